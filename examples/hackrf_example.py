@@ -9,8 +9,12 @@ for RF spectrum analysis and device fingerprinting.
 import asyncio
 import json
 import sys
+from heapq import nlargest
+from operator import attrgetter
 from pathlib import Path
 
+import numpy as np
+
 # Add parent directory to path so we can import fingerprinter modules
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
@@ -18,6 +22,36 @@ from fingerprinter.core.context import ScanContext
 from fingerprinter.core.result import ScanReport
 from fingerprinter.scanners.hackrf import scan as hackrf_scan
 
+# WiFi 2.4GHz channel center frequencies
+WIFI_CHANNELS = {
+    2412e6: 1, 2417e6: 2, 2422e6: 3, 2427e6: 4, 2432e6: 5,
+    2437e6: 6, 2442e6: 7, 2447e6: 8, 2452e6: 9, 2457e6: 10,
+    2462e6: 11, 2467e6: 12, 2472e6: 13, 2484e6: 14
+}
+_WIFI_FREQS = np.array(sorted(WIFI_CHANNELS))
+_WIFI_LABELS = np.array([f"WiFi Channel {WIFI_CHANNELS[f]}" for f in sorted(WIFI_CHANNELS)], dtype=object)
+
+# Band edges for np.digitize. Upper edges are nudged up by one ulp so every
+# band is closed on both ends; cellular fills the gaps between the IoT bands.
+_BAND_EDGES = np.array([
+    430e6, np.nextafter(440e6, np.inf),
+    800e6,
+    860e6, np.nextafter(870e6, np.inf),
+    900e6, np.nextafter(930e6, np.inf),
+    np.nextafter(2000e6, np.inf),
+    2400e6, np.nextafter(2500e6, np.inf),
+    5000e6, np.nextafter(6000e6, np.inf),
+])
+_WIFI_24_BAND = 9
+_BAND_LABELS = np.array([
+    "Unknown", "433MHz IoT/Remote", "Unknown",
+    "Cellular/LTE", "868MHz IoT (EU)", "Cellular/LTE", "915MHz IoT (US)", "Cellular/LTE",
+    "Unknown", "2.4GHz WiFi/Bluetooth", "Unknown", "5GHz WiFi", "Unknown",
+], dtype=object)
+
+SIGNAL_CATEGORIES = ("WiFi Networks", "IoT Devices", "Cellular Signals", "Unknown Signals")
+_BAND_CATEGORY = np.array([3, 1, 3, 2, 1, 2, 1, 2, 3, 0, 3, 0, 3])
+
 
 class MockLogger:
     """Simple logger for examples."""
@@ -67,9 +101,11 @@ async def example_basic_rf_scan():
             print(f"  Noise floor: {rf_scan.noise_floor_db:.1f} dB")
             print(f"  Hot bins: {len(rf_scan.hot_bins)}")
 
-            for bin in rf_scan.hot_bins[:5]:  # Show top 5
-                freq_mhz = bin.frequency_hz / 1e6
-                print(f"    {freq_mhz:8.3f} MHz: {bin.power_db:6.1f} dB")
+            # Show top 5, emitted with a single write
+            top_bins = nlargest(5, rf_scan.hot_bins, key=attrgetter('power_db'))
+            lines = [f"    {bin.frequency_hz / 1e6:8.3f} MHz: {bin.power_db:6.1f} dB" for bin in top_bins]
+            if lines:
+                sys.stdout.write("\n".join(lines) + "\n")
 
     else:
         print("No RF scan results (device not connected or available)")
@@ -107,72 +143,57 @@ async def example_interactive_rf_scan():
     if report.rf_scans:
         print("\n=== Signal Analysis ===")
 
-        all_bins = []
-        for scan in report.rf_scans:
-            all_bins.extend(scan.hot_bins)
+        # Structure-of-arrays view of every hot bin across all bands
+        freqs = np.concatenate([
+            np.fromiter((b.frequency_hz for b in scan.hot_bins), dtype=np.float64, count=len(scan.hot_bins))
+            for scan in report.rf_scans
+        ])
+        powers = np.concatenate([
+            np.fromiter((b.power_db for b in scan.hot_bins), dtype=np.float64, count=len(scan.hot_bins))
+            for scan in report.rf_scans
+        ])
 
-        # Sort by power level
-        all_bins.sort(key=lambda x: x.power_db, reverse=True)
+        # Sort by power level (stable argsort on the negated powers keeps ties in scan order)
+        order = np.argsort(-powers, kind="stable")
+        freqs, powers = freqs[order], powers[order]
 
         # Categorize signals
-        wifi_signals = []
-        iot_signals = []
-        cellular_signals = []
-        unknown_signals = []
-
-        for bin in all_bins:
-            freq_hz = bin.frequency_hz
-
-            if 2400e6 <= freq_hz <= 2500e6:
-                # WiFi 2.4GHz analysis
-                wifi_channels = {
-                    2412e6: 1, 2417e6: 2, 2422e6: 3, 2427e6: 4, 2432e6: 5,
-                    2437e6: 6, 2442e6: 7, 2447e6: 8, 2452e6: 9, 2457e6: 10,
-                    2462e6: 11, 2467e6: 12, 2472e6: 13, 2484e6: 14
-                }
-                closest_freq = min(wifi_channels.keys(), key=lambda x: abs(x - freq_hz))
-                if abs(closest_freq - freq_hz) < 5e6:
-                    channel = wifi_channels[closest_freq]
-                    wifi_signals.append((bin, f"WiFi Channel {channel}"))
-                else:
-                    wifi_signals.append((bin, "2.4GHz WiFi/Bluetooth"))
-
-            elif 5000e6 <= freq_hz <= 6000e6:
-                wifi_signals.append((bin, "5GHz WiFi"))
-
-            elif 430e6 <= freq_hz <= 440e6:
-                iot_signals.append((bin, "433MHz IoT/Remote"))
-
-            elif 860e6 <= freq_hz <= 870e6:
-                iot_signals.append((bin, "868MHz IoT (EU)"))
-
-            elif 900e6 <= freq_hz <= 930e6:
-                iot_signals.append((bin, "915MHz IoT (US)"))
-
-            elif 800e6 <= freq_hz <= 2000e6:
-                cellular_signals.append((bin, "Cellular/LTE"))
-
-            else:
-                unknown_signals.append((bin, "Unknown"))
-
-        # Display categorized results
-        categories = [
-            ("WiFi Networks", wifi_signals),
-            ("IoT Devices", iot_signals),
-            ("Cellular Signals", cellular_signals),
-            ("Unknown Signals", unknown_signals)
-        ]
-
-        for category_name, signals in categories:
-            if signals:
-                print(f"\n{category_name}:")
-                for bin, description in signals:
-                    freq_mhz = bin.frequency_hz / 1e6
-                    print(f"  {freq_mhz:8.3f} MHz ({bin.power_db:6.1f} dB): {description}")
+        categories = classify_signals(freqs)
+
+        for category_name, idx, descriptions in categories:
+            if idx.size:
+                lines = [f"\n{category_name}:"]
+                lines.extend(
+                    f"  {freq_hz / 1e6:8.3f} MHz ({power_db:6.1f} dB): {description}"
+                    for freq_hz, power_db, description in zip(freqs[idx].tolist(), powers[idx].tolist(), descriptions)
+                )
+                sys.stdout.write("\n".join(lines) + "\n")
 
     return report
 
 
+def classify_signals(freqs: np.ndarray) -> list:
+    """Group frequencies by signal category in a single vectorized pass.
+
+    Returns a list of (category_name, indices, descriptions) in
+    SIGNAL_CATEGORIES order; indices select into freqs in ascending order.
+    """
+    # Nearest WiFi channel: compare the neighbours on either side of the insertion point
+    idx = np.clip(np.searchsorted(_WIFI_FREQS, freqs), 1, len(_WIFI_FREQS) - 1)
+    nearest = np.where(freqs - _WIFI_FREQS[idx - 1] <= _WIFI_FREQS[idx] - freqs, idx - 1, idx)
+    on_channel = np.abs(_WIFI_FREQS[nearest] - freqs) < 5e6
+
+    band = np.digitize(freqs, _BAND_EDGES)
+    descriptions = np.where((band == _WIFI_24_BAND) & on_channel, _WIFI_LABELS[nearest], _BAND_LABELS[band])
+    category = _BAND_CATEGORY[band]
+
+    result = []
+    for c, name in enumerate(SIGNAL_CATEGORIES):
+        idx = np.flatnonzero(category == c)
+        result.append((name, idx, descriptions[idx]))
+    return result
+
+
 async def example_json_output():
     """Example: Generate JSON output with RF scan results."""
     print("\n=== JSON Output Example ===")
@@ -182,11 +203,11 @@ async def example_json_output():
     report = await example_basic_rf_scan()
 
     # Convert to JSON
-    json_data = report.asdict()
+    json_data = report.to_json_obj()
 
     print("\nJSON Output (RF scans section):")
-    if 'rf_scans' in json_data and json_data['rf_scans']:
-        print(json.dumps({'rf_scans': json_data['rf_scans']}, indent=2, default=str))
+    if json_data['rf_scans']:
+        print(json.dumps({'rf_scans': json_data['rf_scans']}, indent=2))
     else:
         print("No RF scan data available (simulated output):")
         sample_rf_data = {
@@ -258,8 +279,10 @@ async def main():
     # Check if HackRF tools are available
     import subprocess
     try:
-        result = subprocess.run(['hackrf_info'], capture_output=True, timeout=5)
-        if result.returncode == 0 and b'Found HackRF' in result.stdout:
+        # Short timeout: with no device attached hackrf_info otherwise stalls startup
+        result = subprocess.run(['hackrf_info'], capture_output=True, timeout=1, check=False)
+        # The "Found HackRF" line follows the two version lines at the top of the output
+        if result.returncode == 0 and b'Found HackRF' in result.stdout[:256]:
             print("✅ HackRF device detected and ready!")
         else:
             print("⚠️  HackRF tools available but no device detected")
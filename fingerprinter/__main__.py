@@ -1,22 +1,24 @@
 import asyncio
-import json
 import sys
+import time
 from pathlib import Path
 from fingerprinter.cli import build_parser, validate_args, create_scan_context_from_args, filter_compatible_scanners, print_usage_examples
 from fingerprinter.core.logging import get_logger
 from fingerprinter.scanners import run_scanners, available
 from fingerprinter.report.md import render_markdown
 
-def main(argv: list[str] | None = None) -> None:
-    # Handle special commands before parsing
-    if argv and len(argv) == 1 and argv[0] in ['examples', '--examples']:
-        print_usage_examples()
-        return
+try:
+    # Optional: libuv-backed event loop for faster subprocess spawn and pipe reads
+    import uvloop
+except ImportError:
+    uvloop = None
 
-    # Handle examples command even without argv
+def main(argv: list[str] | None = None) -> None:
     if argv is None:
         argv = sys.argv[1:]
-    if len(argv) == 1 and argv[0] in ['examples', '--examples']:
+
+    # Handle special commands before parsing
+    if argv == ['examples'] or argv == ['--examples']:
         print_usage_examples()
         return
 
@@ -81,7 +83,10 @@ def main(argv: list[str] | None = None) -> None:
         log.info(f"Running scanners: {', '.join(scanners_to_run)}")
 
         # Run the scan
+        if uvloop is not None:
+            asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
         report = asyncio.run(run_scanners(ctx, scanners_to_run, log))
+        finished_ns = time.monotonic_ns()
 
         # Generate output filename
         if args.json_out:
@@ -91,15 +96,15 @@ def main(argv: list[str] | None = None) -> None:
 
         # Write JSON results
         try:
-            with open(out_fp, 'w') as f:
-                json.dump(report.asdict(), f, indent=2, default=str)
+            with open(out_fp, 'wb') as f:
+                f.write(report.to_json())
             log.info(f"Wrote raw results → {out_fp}")
         except Exception as e:
             log.error(f"Failed to write JSON output: {e}")
             sys.exit(1)
 
-        # Generate and display markdown report
-        if not args.no_markdown:
+        # Generate and display markdown report; skipped when piped unless forced
+        if not args.no_markdown and (args.markdown or sys.stdout.isatty()):
             try:
                 markdown_report = render_markdown(report)
                 print(markdown_report)
@@ -127,7 +132,7 @@ def main(argv: list[str] | None = None) -> None:
         if report.has_rf_data:
             total_rf_activity = sum(len(scan.hot_bins) for scan in report.rf_scans)
             print(f"- RF Activity: {total_rf_activity} active frequencies")
-        print(f"- Duration: {(report.finished - report.started).total_seconds():.1f}s")
+        print(f"- Duration: {(finished_ns - ctx.start_ns) / 1e9:.1f}s")
 
     except KeyboardInterrupt:
         log.info("Scan interrupted by user")
@@ -62,6 +62,12 @@ def build_parser() -> argparse.ArgumentParser:
         help="Skip markdown report generation"
     )
 
+    p.add_argument(
+        "--markdown",
+        action="store_true",
+        help="Print the markdown report even when stdout is not a terminal"
+    )
+
     # Scan behavior
     p.add_argument(
         "--interactive",
@@ -76,6 +82,12 @@ def build_parser() -> argparse.ArgumentParser:
         help="Scanner timeout in seconds (default: 3.0)"
     )
 
+    p.add_argument(
+        "--max-parallel",
+        type=int,
+        help="Maximum number of scanners running at once (default: CPU count)"
+    )
+
     p.add_argument(
         "--quick",
         action="store_true",
@@ -107,6 +119,15 @@ def build_parser() -> argparse.ArgumentParser:
     return p
 
 
+def parse_coordinates(value: str) -> tuple[float, float]:
+    """
+    Parse a 'latitude,longitude' string into a (lat, lon) tuple.
+    Raises ValueError if the value is not exactly two floats.
+    """
+    lat, lon = value.split(',')
+    return float(lat), float(lon)
+
+
 def validate_args(args) -> tuple[bool, Optional[str]]:
     """
     Validate command line arguments and return (is_valid, error_message).
@@ -121,12 +142,8 @@ def validate_args(args) -> tuple[bool, Optional[str]]:
             return False, "Coordinates target must be in format 'lat,lon' (e.g., '37.7749,-122.4194')"
 
         try:
-            parts = args.target.split(',')
-            if len(parts) != 2:
-                raise ValueError("Must have exactly 2 parts")
-            float(parts[0])  # latitude
-            float(parts[1])  # longitude
-        except (ValueError, IndexError):
+            parse_coordinates(args.target)
+        except ValueError:
             return False, "Invalid coordinates format. Use 'latitude,longitude' (e.g., '37.7749,-122.4194')"
 
     # Validate module specifications
@@ -138,6 +155,10 @@ def validate_args(args) -> tuple[bool, Optional[str]]:
     if args.timeout <= 0:
         return False, "Timeout must be positive"
 
+    # Validate scanner concurrency (omit the flag to use the default)
+    if args.max_parallel is not None and args.max_parallel <= 0:
+        return False, "--max-parallel must be a positive integer"
+
     return True, None
 
 
@@ -206,6 +227,9 @@ def create_scan_context_from_args(args):
     if args.notes:
         context_kwargs['notes'] = args.notes
 
+    if args.max_parallel is not None:
+        context_kwargs['max_parallel'] = args.max_parallel
+
     return ScanContext(**context_kwargs)
 
 
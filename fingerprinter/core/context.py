@@ -1,56 +1,111 @@
 from dataclasses import dataclass, field
 from datetime import datetime
-from ipaddress import ip_address, AddressValueError
+from ipaddress import ip_address, AddressValueError, IPv4Address, IPv6Address
 from typing import Union, Optional
-from pathlib import Path
 import re
+import sys
+import time
+
+_HOSTNAME_RE = re.compile(r'^[a-zA-Z0-9]([a-zA-Z0-9\-]{0,61}[a-zA-Z0-9])?(\.[a-zA-Z0-9]([a-zA-Z0-9\-]{0,61}[a-zA-Z0-9])?)+$')
+_MAC_RE = re.compile(r'^([0-9A-Fa-f]{2}[:-]){5}([0-9A-Fa-f]{2})$')
+_COORD_RE = re.compile(r'^-?\d+\.?\d*,-?\d+\.?\d*$')
+_SAFE_RE = re.compile(r'[^\w\-_.]')
+_UNDER_RE = re.compile(r'_+')
+# ASCII characters outside [\w\-.] map to '_' (same set _SAFE_RE replaces)
+_SAFE_TABLE = {cp: '_' for cp in range(128) if not (chr(cp).isalnum() or chr(cp) in '-_.')}
+
+# Target types each scanner can handle; scanners not listed are assumed compatible
+# with any target (hackrf, bluetooth, wifi and gps gather context, not per-target data)
+_SCANNER_COMPAT: dict[str, frozenset[str]] = {
+    'nmap': frozenset({'ip', 'hostname'}),
+    'http': frozenset({'ip', 'hostname', 'url'}),
+    'port': frozenset({'ip', 'hostname'}),
+    'arp': frozenset({'ip'}),
+    'file': frozenset({'file'}),
+}
+
+
+def is_scanner_compatible(scanner_name: str, target_type: str) -> bool:
+    """Check if a scanner is compatible with a target type."""
+    compat = _SCANNER_COMPAT.get(scanner_name)
+    return compat is None or target_type in compat
+
+
+# Human-readable labels for target types; others fall back to the title-cased type
+_DISPLAY_PREFIX = {
+    'ip': 'IP',
+    'hostname': 'Host',
+    'coordinates': 'Location',
+    'identifier': 'Target',
+}
+
+
+def format_display_name(target_type: str, value: str) -> str:
+    """Format a target value with a human-readable prefix for its type."""
+    prefix = _DISPLAY_PREFIX.get(target_type)
+    if prefix is None:
+        prefix = target_type.title()
+    return f"{prefix} {value}"
+
 
 @dataclass(frozen=True, slots=True)
 class ScanTarget:
     """Represents a scan target with automatic type detection."""
     value: str
     target_type: Optional[str] = None
+    _ip: Optional[Union[IPv4Address, IPv6Address]] = field(default=None, init=False, repr=False, compare=False)
 
     def __post_init__(self):
         if self.target_type is None:
             # Auto-detect target type
             detected_type = self._detect_type()
             object.__setattr__(self, 'target_type', detected_type)
+        else:
+            # Interned like the detected literals so type comparisons are identity checks
+            object.__setattr__(self, 'target_type', sys.intern(self.target_type))
+
+        # Parse the address once; scanners read ctx.ip repeatedly
+        if self.target_type == 'ip':
+            object.__setattr__(self, '_ip', ip_address(self.value))
 
     def _detect_type(self) -> str:
-        """Automatically detect the target type based on the value."""
-        # Try IP address
-        try:
-            ip_address(self.value)
-            return 'ip'
-        except (AddressValueError, ValueError):
-            pass
+        """
+        Automatically detect the target type based on the value.
 
-        # Check for hostname/domain (must contain at least one dot)
-        hostname_pattern = r'^[a-zA-Z0-9]([a-zA-Z0-9\-]{0,61}[a-zA-Z0-9])?(\.[a-zA-Z0-9]([a-zA-Z0-9\-]{0,61}[a-zA-Z0-9])?)+$'
-        if re.match(hostname_pattern, self.value) and '.' in self.value:
-            return 'hostname'
+        Cheap character tests decide which single validator to run. Local files
+        are only recognised by a path separator; pass target_type='file' for a
+        bare filename.
+        """
+        v = self.value
 
         # Check for URL
-        if self.value.startswith(('http://', 'https://', 'ftp://')):
+        if v.startswith(('http://', 'https://', 'ftp://')):
             return 'url'
 
-        # Check for MAC address
-        mac_pattern = r'^([0-9A-Fa-f]{2}[:-]){5}([0-9A-Fa-f]{2})$'
-        if re.match(mac_pattern, self.value):
+        if ',' in v:
+            # Check for geographic coordinates
+            if _COORD_RE.match(v):
+                return 'coordinates'
+        elif ':' in v or v[:1].isdigit():
+            # Try IP address (IPv6 always has a colon, IPv4 starts with a digit)
+            try:
+                ip_address(v)
+                return 'ip'
+            except (AddressValueError, ValueError):
+                pass
+
+            # Check for MAC address
+            if _MAC_RE.match(v):
+                return 'mac'
+        elif '-' in v and _MAC_RE.match(v):
             return 'mac'
 
-        # Check for Bluetooth address
-        if re.match(mac_pattern, self.value):
-            return 'bluetooth'
-
-        # Check for geographic coordinates
-        coord_pattern = r'^-?\d+\.?\d*,-?\d+\.?\d*$'
-        if re.match(coord_pattern, self.value):
-            return 'coordinates'
+        # Check for hostname/domain (must contain at least one dot)
+        if '.' in v and _HOSTNAME_RE.match(v):
+            return 'hostname'
 
         # Check for file path
-        if Path(self.value).exists() or '/' in self.value or '\\' in self.value:
+        if '/' in v or '\\' in v:
             return 'file'
 
         # Default to generic identifier
@@ -69,16 +124,18 @@ class ScanTarget:
     @property
     def ip(self):
         """Get IP address object if target is an IP, otherwise None."""
-        if self.is_ip:
-            return ip_address(self.value)
-        return None
+        return self._ip
 
     def safe_filename(self) -> str:
         """Generate a safe filename from the target value."""
-        # Replace problematic characters
-        safe = re.sub(r'[^\w\-_.]', '_', self.value)
+        # Replace problematic characters (translate table for ASCII, regex otherwise)
+        if self.value.isascii():
+            safe = self.value.translate(_SAFE_TABLE)
+        else:
+            safe = _SAFE_RE.sub('_', self.value)
         # Remove multiple underscores
-        safe = re.sub(r'_+', '_', safe)
+        if '__' in safe:
+            safe = _UNDER_RE.sub('_', safe)
         # Limit length
         if len(safe) > 50:
             safe = safe[:50]
@@ -94,22 +151,40 @@ class ScanContext:
     target: Union[str, ScanTarget]
     scan_id: Optional[str] = None
     start: datetime = field(default_factory=datetime.utcnow)
+    start_ns: int = field(default_factory=time.monotonic_ns, repr=False)  # Monotonic clock for durations
     timeout: float = 3.0
     interactive: bool = False
     legal_ok: bool = False
     location: Optional[str] = None  # Physical location context
-    notes: list[str] = field(default_factory=list)  # User-provided context notes
+    notes: tuple[str, ...] = ()  # User-provided context notes
+    max_parallel: Optional[int] = None  # Concurrent scanner cap (None = CPU count)
 
     def __post_init__(self):
         # Ensure target is a ScanTarget object
         if isinstance(self.target, str):
             object.__setattr__(self, 'target', ScanTarget(self.target))
 
+        # Notes are fixed for the scan; store them immutably so they can be shared
+        if not isinstance(self.notes, tuple):
+            object.__setattr__(self, 'notes', tuple(self.notes))
+
         # Generate scan_id if not provided
         if self.scan_id is None:
             timestamp = self.start.strftime("%Y%m%d_%H%M%S")
             object.__setattr__(self, 'scan_id', f"{self.target.safe_filename()}_{timestamp}")
 
+    @classmethod
+    def from_raw(cls, target: Union[str, ScanTarget], **kwargs) -> 'ScanContext':
+        """
+        Build a context with the ScanTarget and scan_id resolved up front, so
+        __post_init__ has nothing left to normalize.
+        """
+        if not isinstance(target, ScanTarget):
+            target = ScanTarget(target)
+        start = kwargs.pop('start', None) or datetime.utcnow()
+        scan_id = kwargs.pop('scan_id', None) or f"{target.safe_filename()}_{start.strftime('%Y%m%d_%H%M%S')}"
+        return cls(target=target, scan_id=scan_id, start=start, **kwargs)
+
     @property
     def ip(self):
         """Legacy property for backward compatibility."""
@@ -135,16 +210,7 @@ class ScanContext:
     @property
     def display_name(self) -> str:
         """Get a human-readable display name for the target."""
-        if self.target_type == 'ip':
-            return f"IP {self.target_value}"
-        elif self.target_type == 'hostname':
-            return f"Host {self.target_value}"
-        elif self.target_type == 'coordinates':
-            return f"Location {self.target_value}"
-        elif self.target_type == 'identifier':
-            return f"Target {self.target_value}"
-        else:
-            return f"{self.target_type.title()} {self.target_value}"
+        return format_display_name(self.target_type, self.target_value)
 
     def json_out(self) -> str:
         """Generate output filename for JSON results."""
@@ -152,28 +218,7 @@ class ScanContext:
 
     def supports_scanner(self, scanner_name: str) -> bool:
         """Check if a scanner is compatible with this target type."""
-        scanner_compatibility = {
-            'nmap': ['ip', 'hostname'],
-            'http': ['ip', 'hostname', 'url'],
-            'port': ['ip', 'hostname'],
-            'arp': ['ip'],
-            'hackrf': ['*'],  # RF scanning works with any target (used for context/location)
-            'bluetooth': ['bluetooth', 'mac', '*'],
-            'wifi': ['*'],  # WiFi scanning works with any target
-            'gps': ['coordinates', '*'],
-            'file': ['file'],
-        }
-
-        if scanner_name not in scanner_compatibility:
-            return True  # Unknown scanners are assumed compatible
-
-        compatible_types = scanner_compatibility[scanner_name]
-
-        # '*' means compatible with any target type
-        if '*' in compatible_types:
-            return True
-
-        return self.target_type in compatible_types
+        return is_scanner_compatible(scanner_name, self.target_type)
 
     def get_context_description(self) -> str:
         """Generate a description of the scan context."""
@@ -190,7 +235,7 @@ class ScanContext:
 
 def create_scan_context(target: str, **kwargs) -> ScanContext:
     """Factory function to create a ScanContext with proper target detection."""
-    return ScanContext(target=target, **kwargs)
+    return ScanContext.from_raw(target, **kwargs)
 
 
 # Convenience functions for specific target types
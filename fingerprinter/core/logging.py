@@ -2,8 +2,15 @@ from rich.console import Console
 from rich.logging import RichHandler
 import logging
 
+_LOGGER: logging.Logger | None = None
+
 def get_logger(verbosity: int = 0) -> logging.Logger:
+    # basicConfig only takes effect once, so later calls just reuse the logger
+    global _LOGGER
+    if _LOGGER is not None:
+        return _LOGGER
     level = logging.WARNING - min(verbosity, 2) * 10
     handler = RichHandler(console=Console(stderr=True), show_time=False, show_level=True)
     logging.basicConfig(level=level, format="%(message)s", handlers=[handler])
-    return logging.getLogger("fp")
+    _LOGGER = logging.getLogger("fp")
+    return _LOGGER
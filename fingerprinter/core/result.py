@@ -1,8 +1,16 @@
-from dataclasses import dataclass, field, asdict
+from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Literal, Optional
+import sys
+import orjson
+from fingerprinter.core.context import format_display_name
 
-@dataclass
+# Native numpy arrays/scalars (RF data) and non-string dict keys (stdlib json's behaviour);
+# datetimes go through default=str so reports keep the 'YYYY-MM-DD HH:MM:SS.ffffff' format
+JSON_OPTIONS = (orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+                | orjson.OPT_PASSTHROUGH_DATETIME)
+
+@dataclass(slots=True)
 class PortInfo:
     port: int
     proto: Literal["tcp", "udp"]
@@ -16,7 +24,26 @@ class PortInfo:
     fingerprint: str | None = None
     raw_fingerprint: str | None = None
 
-@dataclass
+    def __post_init__(self):
+        # Interned so the many proto comparisons/dict keys hit the identity fast path
+        self.proto = sys.intern(self.proto)
+
+    def to_json_obj(self) -> dict:
+        return {
+            'port': self.port,
+            'proto': self.proto,
+            'banner': self.banner,
+            'service': self.service,
+            'product': self.product,
+            'version': self.version,
+            'extrainfo': self.extrainfo,
+            'confidence': self.confidence,
+            'method': self.method,
+            'fingerprint': self.fingerprint,
+            'raw_fingerprint': self.raw_fingerprint,
+        }
+
+@dataclass(slots=True)
 class FrequencyBin:
     frequency_hz: float
     power_db: float
@@ -24,7 +51,16 @@ class FrequencyBin:
     detection_method: str
     timestamp: datetime
 
-@dataclass
+    def to_json_obj(self) -> dict:
+        return {
+            'frequency_hz': self.frequency_hz,
+            'power_db': self.power_db,
+            'bandwidth_hz': self.bandwidth_hz,
+            'detection_method': self.detection_method,
+            'timestamp': self.timestamp.isoformat(),
+        }
+
+@dataclass(slots=True)
 class RfScanInfo:
     center_freq_hz: float
     sample_rate_hz: float
@@ -36,14 +72,35 @@ class RfScanInfo:
     noise_floor_db: float
     detection_threshold_db: float
 
-@dataclass
+    def to_json_obj(self) -> dict:
+        return {
+            'center_freq_hz': self.center_freq_hz,
+            'sample_rate_hz': self.sample_rate_hz,
+            'bandwidth_hz': self.bandwidth_hz,
+            'gain_db': self.gain_db,
+            'hot_bins': [b.to_json_obj() for b in self.hot_bins],
+            'scan_duration_sec': self.scan_duration_sec,
+            'total_samples': self.total_samples,
+            'noise_floor_db': self.noise_floor_db,
+            'detection_threshold_db': self.detection_threshold_db,
+        }
+
+@dataclass(slots=True)
 class HttpInfo:
     url: str
     status: int
     title: str | None
     signatures: list[str]
 
-@dataclass
+    def to_json_obj(self) -> dict:
+        return {
+            'url': self.url,
+            'status': self.status,
+            'title': self.title,
+            'signatures': list(self.signatures),
+        }
+
+@dataclass(slots=True)
 class ScanReport:
     target: str
     target_type: str
@@ -58,19 +115,13 @@ class ScanReport:
     notes: list[str] = field(default_factory=list)  # Scanner-generated notes
     scanner_results: dict = field(default_factory=dict)  # Future extensibility
 
+    def __post_init__(self):
+        self.target_type = sys.intern(self.target_type)
+
     @property
     def display_target(self) -> str:
         """Get a human-readable target description."""
-        if self.target_type == 'ip':
-            return f"IP {self.target}"
-        elif self.target_type == 'hostname':
-            return f"Host {self.target}"
-        elif self.target_type == 'coordinates':
-            return f"Location {self.target}"
-        elif self.target_type == 'identifier':
-            return f"Target {self.target}"
-        else:
-            return f"{self.target_type.title()} {self.target}"
+        return format_display_name(self.target_type, self.target)
 
     @property
     def is_network_scan(self) -> bool:
@@ -99,5 +150,34 @@ class ScanReport:
 
         return " | ".join(parts)
 
-    def asdict(self):
-        return asdict(self)
+    def asdict(self) -> dict:
+        """Plain-dict form of the report; same as to_json_obj()."""
+        return self.to_json_obj()
+
+    def to_json(self, option: int = JSON_OPTIONS) -> bytes:
+        """
+        Serialize the report to JSON bytes. orjson walks the dataclasses
+        directly, so no intermediate dict tree is built.
+        """
+        return orjson.dumps(self, default=str, option=option)
+
+    def to_json_obj(self) -> dict:
+        """
+        Return the report as JSON-compatible primitives (datetimes as ISO 8601).
+        Nested records are converted field by field rather than through
+        dataclasses.asdict's recursive deep copy.
+        """
+        return {
+            'target': self.target,
+            'target_type': self.target_type,
+            'scan_id': self.scan_id,
+            'started': self.started.isoformat(),
+            'finished': self.finished.isoformat() if self.finished else None,
+            'location': self.location,
+            'context_notes': list(self.context_notes),
+            'ports': [p.to_json_obj() for p in self.ports],
+            'http': [h.to_json_obj() for h in self.http],
+            'rf_scans': [s.to_json_obj() for s in self.rf_scans],
+            'notes': list(self.notes),
+            'scanner_results': dict(self.scanner_results),
+        }
@@ -1,17 +1,44 @@
 import importlib
+import os
 import pkgutil
+import sys
 import asyncio
+import time
+from collections import Counter
 from datetime import datetime
+from functools import lru_cache
 from typing import Iterable, Optional
-from fingerprinter.core.result import ScanReport
-from fingerprinter.core.context import ScanContext
+from fingerprinter.core.result import PortInfo, ScanReport
+from fingerprinter.core.context import ScanContext, is_scanner_compatible
 
-mods = [m.name for m in pkgutil.iter_modules(__path__) if m.name != "__init__"]
+mods = [sys.intern(m.name) for m in pkgutil.iter_modules(__path__) if m.name != "__init__"]
 
 def available() -> list[str]:
     """Get list of available scanner modules."""
     return mods
 
+@lru_cache(maxsize=16)
+def _compatible_scanners(target_type: str) -> tuple[str, ...]:
+    """Available scanners compatible with a target type (cached per type)."""
+    return tuple(name for name in mods if is_scanner_compatible(name, target_type))
+
+@lru_cache(maxsize=None)
+def _load_scanner(name: str):
+    """Import a scanner module once; later calls are a cache hit."""
+    return importlib.import_module(f".{name}", package=__package__)
+
+async def close_scanners() -> None:
+    """
+    Release resources scanners keep across scans (e.g. pooled HTTP sessions).
+
+    Scanners may define an async close(); it is awaited for every scanner
+    module that has been loaded. run_scanners() calls this when its scanners finish.
+    """
+    for name in mods:
+        close = getattr(sys.modules.get(f"{__package__}.{name}"), "close", None)
+        if close is not None:
+            await close()
+
 async def run_scanners(ctx: ScanContext,
                        scanners_to_run: Iterable[str] | None,
                        log) -> ScanReport:
@@ -33,7 +60,7 @@ async def run_scanners(ctx: ScanContext,
         scan_id=ctx.scan_id,
         started=ctx.start,
         location=ctx.location,
-        context_notes=ctx.notes.copy() if ctx.notes else []
+        context_notes=list(ctx.notes)
     )
 
     log.info(f"Scan initialized: {report.get_context_summary()}")
@@ -48,36 +75,45 @@ async def run_scanners(ctx: ScanContext,
             log.debug(f"Skipping {name}: incompatible with {ctx.target_type} target")
             return
 
-        log.info(f"Starting {name} scanner")
-        start_time = datetime.utcnow()
+        async with semaphore:
+            log.info(f"Starting {name} scanner")
+            start_time = time.perf_counter()
 
-        try:
-            mod = importlib.import_module(f".{name}", package=__package__)
-            if not hasattr(mod, "scan"):
-                log.warning(f"Scanner {name} has no .scan() function")
-                report.notes.append(f"Scanner {name}: missing scan function")
-                return
+            try:
+                scan = getattr(_load_scanner(name), "scan", None)
+                if scan is None:
+                    log.warning(f"Scanner {name} has no .scan() function")
+                    report.notes.append(f"Scanner {name}: missing scan function")
+                    return
 
-            # Run the scanner
-            await mod.scan(ctx, report, log)
+                # Run the scanner
+                await scan(ctx, report, log)
 
-            duration = (datetime.utcnow() - start_time).total_seconds()
-            log.info(f"Scanner {name} completed in {duration:.1f}s")
+                duration = time.perf_counter() - start_time
+                log.info(f"Scanner {name} completed in {duration:.1f}s")
 
-        except Exception as exc:
-            duration = (datetime.utcnow() - start_time).total_seconds()
-            log.exception(f"Scanner '{name}' failed after {duration:.1f}s: {exc}")
-            report.notes.append(f"Scanner {name} error: {str(exc)}")
+            except Exception as exc:
+                duration = time.perf_counter() - start_time
+                log.exception(f"Scanner '{name}' failed after {duration:.1f}s: {exc}")
+                report.notes.append(f"Scanner {name} error: {str(exc)}")
 
     # Determine which scanners to run
     if scanners_to_run is None:
         # Run all available compatible scanners
-        compatible_scanners = [name for name in mods if ctx.supports_scanner(name)]
-        log.info(f"Auto-selected compatible scanners: {', '.join(compatible_scanners)}")
-        await asyncio.gather(*[_run_scanner(name) for name in compatible_scanners])
+        names = _compatible_scanners(ctx.target_type)
+        log.info(f"Auto-selected compatible scanners: {', '.join(names)}")
     else:
         # Run specified scanners
-        await asyncio.gather(*[_run_scanner(name) for name in scanners_to_run])
+        names = list(scanners_to_run)
+
+    # Run scanners concurrently, capped so subprocess/socket-heavy scanners don't all start at once
+    semaphore = asyncio.Semaphore(max(1, ctx.max_parallel or min(len(names), os.cpu_count() or 4)))
+    try:
+        for finished in asyncio.as_completed([_run_scanner(name) for name in names]):
+            await finished
+    finally:
+        # Pooled resources (e.g. the HTTP session) live only as long as this run
+        await close_scanners()
 
     report.finished = datetime.utcnow()
 
@@ -85,7 +121,7 @@ async def run_scanners(ctx: ScanContext,
     _merge_duplicate_ports(report)
     _add_scan_metadata(report, ctx, log)
 
-    total_duration = (report.finished - report.started).total_seconds()
+    total_duration = (time.monotonic_ns() - ctx.start_ns) / 1e9
     log.info(f"Scan completed in {total_duration:.1f}s")
 
     return report
@@ -96,72 +132,52 @@ def _merge_duplicate_ports(report: ScanReport) -> None:
     if not report.ports:
         return
 
-    # Group ports by (port, proto) key
-    port_groups = {}
+    # Single pass: the first entry for each (port, proto) absorbs later duplicates
+    merged = {}
     for port_info in report.ports:
         key = (port_info.port, port_info.proto)
-        if key not in port_groups:
-            port_groups[key] = []
-        port_groups[key].append(port_info)
-
-    # Merge each group
-    merged_ports = []
-    for key, ports in port_groups.items():
-        if len(ports) == 1:
-            merged_ports.append(ports[0])
+        existing = merged.get(key)
+        if existing is None:
+            merged[key] = port_info
         else:
-            # Merge multiple entries for the same port
-            merged = _merge_port_entries(ports)
-            merged_ports.append(merged)
+            _merge_in_place(existing, port_info)
 
-    report.ports = merged_ports
+    report.ports = list(merged.values())
 
 
-def _merge_port_entries(ports: list) -> 'PortInfo':
-    """Merge multiple PortInfo entries for the same port, keeping best data."""
-    from fingerprinter.core.result import PortInfo
+def _merge_in_place(merged: PortInfo, port: PortInfo) -> None:
+    """Merge a duplicate PortInfo entry into an existing one, keeping best data."""
+    # Prefer longer/more detailed banners
+    if not merged.banner or (port.banner and len(port.banner) > len(merged.banner or "")):
+        merged.banner = port.banner
 
-    # Start with first entry
-    merged = PortInfo(
-        port=ports[0].port,
-        proto=ports[0].proto
-    )
-
-    # Merge data from all entries, preferring non-null/non-empty values
-    for port in ports:
-        # Prefer longer/more detailed banners
-        if not merged.banner or (port.banner and len(port.banner) > len(merged.banner or "")):
-            merged.banner = port.banner
-
-        # Prefer specific service names over generic ones
-        if not merged.service or (port.service and port.service != "unknown"):
-            merged.service = port.service
-
-        # Always take product/version if available
-        if port.product:
-            merged.product = port.product
-        if port.version:
-            merged.version = port.version
-        if port.extrainfo:
-            merged.extrainfo = port.extrainfo
+    # Prefer specific service names over generic ones
+    if not merged.service or (port.service and port.service != "unknown"):
+        merged.service = port.service
 
-        # Take confidence if higher
-        if port.confidence and (not merged.confidence or port.confidence > merged.confidence):
-            merged.confidence = port.confidence
+    # Always take product/version if available
+    if port.product:
+        merged.product = port.product
+    if port.version:
+        merged.version = port.version
+    if port.extrainfo:
+        merged.extrainfo = port.extrainfo
 
-        # Take method if available
-        if port.method:
-            merged.method = port.method
+    # Take confidence if higher
+    if port.confidence and (not merged.confidence or port.confidence > merged.confidence):
+        merged.confidence = port.confidence
 
-        # Prefer structured fingerprints
-        if port.fingerprint:
-            merged.fingerprint = port.fingerprint
+    # Take method if available
+    if port.method:
+        merged.method = port.method
 
-        # Always take raw fingerprints
-        if port.raw_fingerprint:
-            merged.raw_fingerprint = port.raw_fingerprint
+    # Prefer structured fingerprints
+    if port.fingerprint:
+        merged.fingerprint = port.fingerprint
 
-    return merged
+    # Always take raw fingerprints
+    if port.raw_fingerprint:
+        merged.raw_fingerprint = port.raw_fingerprint
 
 
 def _add_scan_metadata(report: ScanReport, ctx: ScanContext, log) -> None:
@@ -177,8 +193,9 @@ def _add_scan_metadata(report: ScanReport, ctx: ScanContext, log) -> None:
 
     # Add scan statistics
     if report.ports:
-        tcp_ports = len([p for p in report.ports if p.proto == 'tcp'])
-        udp_ports = len([p for p in report.ports if p.proto == 'udp'])
+        proto_counts = Counter(p.proto for p in report.ports)
+        tcp_ports = proto_counts['tcp']
+        udp_ports = proto_counts['udp']
         if tcp_ports and udp_ports:
             report.notes.append(f"Ports discovered: {tcp_ports} TCP, {udp_ports} UDP")
         elif tcp_ports:
@@ -195,11 +212,7 @@ def _add_scan_metadata(report: ScanReport, ctx: ScanContext, log) -> None:
 
     # Add HTTP service summary
     if report.http:
-        status_counts = {}
-        for http_info in report.http:
-            status = http_info.status
-            status_counts[status] = status_counts.get(status, 0) + 1
-
+        status_counts = Counter(h.status for h in report.http)
         status_summary = ", ".join([f"{count}×{status}" for status, count in sorted(status_counts.items())])
         report.notes.append(f"HTTP services: {len(report.http)} endpoints ({status_summary})")
 
@@ -207,7 +220,7 @@ def _add_scan_metadata(report: ScanReport, ctx: ScanContext, log) -> None:
 def get_scanner_info(scanner_name: str) -> dict:
     """Get information about a specific scanner module."""
     try:
-        mod = importlib.import_module(f".{scanner_name}", package=__package__)
+        mod = _load_scanner(scanner_name)
 
         info = {
             'name': scanner_name,
@@ -252,26 +265,6 @@ def validate_scanner_compatibility(scanner_names: list[str], target_type: str) -
             'unknown': [list of scanner names that couldn't be checked]
         }
     """
-    from fingerprinter.core.context import ScanTarget
-
-    # Create a dummy target for compatibility checking
-    dummy_target = ScanTarget("dummy", target_type=target_type)
-    dummy_ctx = type('DummyContext', (), {
-        'target': dummy_target,
-        'target_type': target_type,
-        'supports_scanner': lambda self, scanner: dummy_target.target_type in {
-            'nmap': ['ip', 'hostname'],
-            'http': ['ip', 'hostname', 'url'],
-            'port': ['ip', 'hostname'],
-            'arp': ['ip'],
-            'hackrf': ['*'],
-            'bluetooth': ['bluetooth', 'mac', '*'],
-            'wifi': ['*'],
-            'gps': ['coordinates', '*'],
-            'file': ['file'],
-        }.get(scanner, ['*'])
-    })()
-
     result = {
         'compatible': [],
         'incompatible': [],
@@ -279,12 +272,9 @@ def validate_scanner_compatibility(scanner_names: list[str], target_type: str) -
     }
 
     for scanner_name in scanner_names:
-        try:
-            if dummy_ctx.supports_scanner(scanner_name):
-                result['compatible'].append(scanner_name)
-            else:
-                result['incompatible'].append(scanner_name)
-        except Exception:
-            result['unknown'].append(scanner_name)
+        if is_scanner_compatible(scanner_name, target_type):
+            result['compatible'].append(scanner_name)
+        else:
+            result['incompatible'].append(scanner_name)
 
     return result
@@ -1,5 +1,7 @@
 import asyncio
-import subprocess
+import json
+import socket
+from functools import lru_cache
 from fingerprinter.core.context import ScanContext
 from fingerprinter.core.result import ScanReport
 
@@ -30,41 +32,77 @@ async def scan(ctx: ScanContext, report: ScanReport, log) -> None:
         report.notes.append(f"ARP scan error: {str(e)}")
 
 
+_PROC_ARP = "/proc/net/arp"
+
+# (network, mask) pairs for addresses that can be on the local link
+_LOCAL_V4 = (
+    (0x0A000000, 0xFF000000),  # 10.0.0.0/8
+    (0xAC100000, 0xFFF00000),  # 172.16.0.0/12
+    (0xC0A80000, 0xFFFF0000),  # 192.168.0.0/16
+    (0xA9FE0000, 0xFFFF0000),  # 169.254.0.0/16 link-local
+    (0x7F000000, 0xFF000000),  # 127.0.0.0/8 loopback
+)
+_LOCAL_V6 = (
+    (0xFC00 << 112, 0xFE00 << 112),  # fc00::/7 unique local
+    (0xFE80 << 112, 0xFFC0 << 112),  # fe80::/10 link-local
+    (1, (1 << 128) - 1),             # ::1 loopback
+)
+
+
+@lru_cache(maxsize=4096)
 def _is_local_network(ip_str: str) -> bool:
     """
     Check if IP address is in a local network range.
     """
-    import ipaddress
+    # Drop an IPv6 zone index (fe80::1%eth0); inet_pton doesn't accept it
+    addr = ip_str.partition('%')[0]
 
     try:
-        ip = ipaddress.ip_address(ip_str)
-
-        # Check for private networks
-        if ip.is_private:
-            return True
-
-        # Check for link-local
-        if ip.is_link_local:
-            return True
-
-        # Check for loopback
-        if ip.is_loopback:
+        ip = int.from_bytes(socket.inet_pton(socket.AF_INET, addr), 'big')
+        networks = _LOCAL_V4
+    except (OSError, ValueError):
+        try:
+            ip = int.from_bytes(socket.inet_pton(socket.AF_INET6, addr), 'big')
+            networks = _LOCAL_V6
+        except (OSError, ValueError):
+            return False
+
+    for net, mask in networks:
+        if ip & mask == net:
             return True
+    return False
 
-    except ValueError:
-        pass
 
-    return False
+def _lookup_proc_arp(ip_str: str) -> str | None:
+    """
+    Find the IPv4 ARP entry in /proc/net/arp (what `arp -n` prints).
+    Raises OSError where the file doesn't exist (non-Linux).
+    """
+    with open(_PROC_ARP) as f:
+        next(f, None)  # Header: IP address, HW type, Flags, HW address, Mask, Device
+        for line in f:
+            parts = line.split()
+            # An all-zero address means resolution is still incomplete
+            if len(parts) >= 4 and parts[0] == ip_str and parts[3] != "00:00:00:00:00:00":
+                return f"MAC {parts[3]}"
+    return None
 
 
 async def _get_arp_info(ctx: ScanContext, log) -> str | None:
     """
     Get ARP information for the target IP.
     """
+    # IPv4 on Linux: read the kernel ARP table directly, no subprocess needed
+    if ctx.ip.version == 4:
+        try:
+            return _lookup_proc_arp(str(ctx.ip))
+        except OSError:
+            pass
+
     try:
-        # Try to get ARP table entry
+        # Kernel neighbour table (ARP for IPv4, NDP for IPv6) as JSON
         proc = await asyncio.create_subprocess_exec(
-            "arp", "-n", str(ctx.ip),
+            "ip", "-j", "neighbor", "show", str(ctx.ip),
             stdout=asyncio.subprocess.PIPE,
             stderr=asyncio.subprocess.PIPE
         )
@@ -74,41 +112,14 @@ async def _get_arp_info(ctx: ScanContext, log) -> str | None:
             timeout=ctx.timeout
         )
 
-        if proc.returncode == 0 and stdout:
-            output = stdout.decode('utf-8', errors='ignore').strip()
-
-            # Parse ARP output
-            lines = output.split('\n')
-            for line in lines:
-                if str(ctx.ip) in line and 'incomplete' not in line.lower():
-                    parts = line.split()
-                    if len(parts) >= 3:
-                        # Format: IP HWtype HWaddress Flags Mask Iface
-                        mac = parts[2] if parts[2] != "(incomplete)" else None
-                        if mac and mac != "no" and ":" in mac:
-                            return f"MAC {mac}"
-
-        # If arp command failed or no entry, try ip neighbor
-        proc2 = await asyncio.create_subprocess_exec(
-            "ip", "neighbor", "show", str(ctx.ip),
-            stdout=asyncio.subprocess.PIPE,
-            stderr=asyncio.subprocess.PIPE
-        )
-
-        stdout2, stderr2 = await asyncio.wait_for(
-            proc2.communicate(),
-            timeout=ctx.timeout
-        )
-
-        if proc2.returncode == 0 and stdout2:
-            output2 = stdout2.decode('utf-8', errors='ignore').strip()
-
-            # Parse ip neighbor output
-            if output2 and str(ctx.ip) in output2:
-                parts = output2.split()
-                for i, part in enumerate(parts):
-                    if ":" in part and len(part) == 17:  # MAC address format
-                        return f"MAC {part}"
+        if proc.returncode == 0 and stdout.strip():
+            for entry in json.loads(stdout):
+                if entry.get("dst") != str(ctx.ip):
+                    continue
+                mac = entry.get("lladdr")
+                # Entries still resolving (INCOMPLETE) or FAILED have no usable lladdr
+                if mac and "FAILED" not in entry.get("state", ()):
+                    return f"MAC {mac}"
 
     except (FileNotFoundError, asyncio.TimeoutError):
         # Command not available or timeout
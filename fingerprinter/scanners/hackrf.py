@@ -1,12 +1,18 @@
 import asyncio
 import json
-import subprocess
+import math
+import shutil
+import struct
 import tempfile
 import numpy as np
 from datetime import datetime
 from typing import List, Optional, Tuple
 import os
 import time
+from bisect import bisect_right
+from heapq import nlargest
+from itertools import chain
+from operator import attrgetter
 from rich.console import Console
 from rich.progress import Progress, BarColumn, TextColumn, TimeRemainingColumn, SpinnerColumn
 from rich.live import Live
@@ -38,17 +44,17 @@ SCANNER_INFO = {
     ]
 }
 
-# Check for HackRF tools availability
-def _check_hackrf_tools():
-    """Check if HackRF command-line tools are available."""
-    try:
-        result = subprocess.run(['hackrf_info'], capture_output=True, timeout=5)
-        # Tools are available if the command runs (even if no device found)
-        return True
-    except (subprocess.TimeoutExpired, FileNotFoundError, subprocess.SubprocessError):
-        return False
+# HackRF tools availability, resolved on first scan rather than at import
+_HACKRF_AVAILABLE: Optional[bool] = None
 
-HACKRF_AVAILABLE = _check_hackrf_tools()
+def _hackrf_tools_available() -> bool:
+    """Check (once) if HackRF command-line tools are available."""
+    global _HACKRF_AVAILABLE
+    if _HACKRF_AVAILABLE is None:
+        # Tools are available if the binary is on PATH (even if no device found);
+        # _verify_hackrf_device runs hackrf_info to check for hardware
+        _HACKRF_AVAILABLE = shutil.which('hackrf_info') is not None
+    return _HACKRF_AVAILABLE
 
 # Common frequency ranges of interest (in Hz)
 FREQUENCY_RANGES = {
@@ -71,6 +77,24 @@ FREQUENCY_RANGES = {
 HACKRF_MIN_FREQ = 1e6      # 1 MHz
 HACKRF_MAX_FREQ = 6e9      # 6 GHz
 DEFAULT_SAMPLE_RATE = 10e6  # 10 MHz sample rate
+SWEEP_BIN_HZ = 1e6          # hackrf_sweep bin width (-w)
+
+# Ranges within HackRF capability; only depends on the constants above
+_VALID_RANGES = {
+    name: (freq_min, freq_max)
+    for name, (freq_min, freq_max) in FREQUENCY_RANGES.items()
+    if freq_max >= HACKRF_MIN_FREQ and freq_min <= HACKRF_MAX_FREQ
+}
+
+# Ranges to scan per scan mode (see _scan_mode)
+_RANGES_BY_MODE = {
+    'interactive': tuple(name for name in ('wifi_2g4', 'bluetooth', 'ism_433', 'ism_915') if name in _VALID_RANGES),
+    # For network targets, focus on WiFi and IoT frequencies
+    'network': tuple(name for name in ('wifi_2g4', 'wifi_5g_low', 'bluetooth', 'ism_433', 'ism_868', 'ism_915')
+                     if name in _VALID_RANGES),
+    # Comprehensive scan (geographic and other targets)
+    'default': tuple(_VALID_RANGES),
+}
 
 
 async def scan(ctx: ScanContext, report: ScanReport, log) -> None:
@@ -80,7 +104,7 @@ async def scan(ctx: ScanContext, report: ScanReport, log) -> None:
     Works with any target type - the target is used for context and identification.
     For location-based targets, coordinates can be used for geographic context.
     """
-    if not HACKRF_AVAILABLE:
+    if not _hackrf_tools_available():
         log.warning("HackRF tools not available. Install hackrf package and ensure device permissions.")
         log.info("On Ubuntu/Debian: sudo apt install hackrf")
         log.info("Add user to plugdev group: sudo usermod -a -G plugdev $USER")
@@ -113,56 +137,42 @@ async def scan(ctx: ScanContext, report: ScanReport, log) -> None:
         rf_results = []
 
         # Determine scan strategy based on target type and context
-        if ctx.interactive:
-            ranges_to_scan = ['wifi_2g4', 'bluetooth', 'ism_433', 'ism_915']
-        elif ctx.target_type == 'coordinates':
-            # For geographic targets, do comprehensive scan
-            ranges_to_scan = list(FREQUENCY_RANGES.keys())
-        elif ctx.target_type in ['ip', 'hostname']:
-            # For network targets, focus on WiFi and IoT frequencies
-            ranges_to_scan = ['wifi_2g4', 'wifi_5g_low', 'bluetooth', 'ism_433', 'ism_868', 'ism_915']
-        else:
-            # Default comprehensive scan
-            ranges_to_scan = list(FREQUENCY_RANGES.keys())
-
-        # Filter out ranges outside HackRF capability
-        valid_ranges = []
-        for range_name in ranges_to_scan:
-            if range_name not in FREQUENCY_RANGES:
-                continue
-            freq_min, freq_max = FREQUENCY_RANGES[range_name]
-            if freq_max < HACKRF_MIN_FREQ or freq_min > HACKRF_MAX_FREQ:
-                continue
-            valid_ranges.append(range_name)
+        valid_ranges = _RANGES_BY_MODE[_scan_mode(ctx)]
 
         console.print(f"[bold cyan]🎯 Scanning {len(valid_ranges)} frequency ranges[/bold cyan]")
 
-        # Scan each frequency range with unified progress display
         for i, range_name in enumerate(valid_ranges):
-            freq_min, freq_max = FREQUENCY_RANGES[range_name]
-
-            console.print(f"\n[bold blue]📡 [{i+1}/{len(valid_ranges)}] Scanning {range_name}: {freq_min/1e6:.1f} - {freq_max/1e6:.1f} MHz[/bold blue]")
-
-            try:
-                rf_scan = await _scan_frequency_range_with_progress(
-                    range_name, freq_min, freq_max, ctx, log, console, i+1, len(valid_ranges)
-                )
-                if rf_scan:
-                    rf_results.append(rf_scan)
-                    console.print(f"[green]✅ Found {len(rf_scan.hot_bins)} active frequencies in {range_name}[/green]")
-
-                    # Show top signals immediately
-                    if rf_scan.hot_bins:
-                        top_signals = sorted(rf_scan.hot_bins, key=lambda x: x.power_db, reverse=True)[:3]
-                        for j, signal in enumerate(top_signals, 1):
-                            freq_desc = _get_frequency_description(signal.frequency_hz)
-                            console.print(f"[cyan]    {j}. {signal.frequency_hz/1e6:.3f} MHz: {signal.power_db:.1f} dB ({freq_desc})[/cyan]")
-                else:
-                    console.print(f"[dim]⚪ No activity detected in {range_name}[/dim]")
+            freq_min, freq_max = _VALID_RANGES[range_name]
+            console.print(f"[blue]    [{i+1}/{len(valid_ranges)}] {range_name}: {freq_min/1e6:.1f} - {freq_max/1e6:.1f} MHz[/blue]")
 
-            except Exception as e:
-                console.print(f"[red]❌ Error scanning {range_name}: {e}[/red]")
-                report.notes.append(f"RF scan error ({range_name}): {str(e)}")
+        # One hackrf_sweep covers every range, so the radio is opened and
+        # retuned once; each range keeps the same dwell time as a separate sweep
+        dwell = 3.0 if ctx.interactive else 8.0
+        try:
+            freqs, peak = await _sweep_with_progress(
+                [_VALID_RANGES[name] for name in valid_ranges], dwell * len(valid_ranges), log, console
+            )
+        except Exception as e:
+            console.print(f"[red]❌ Error running sweep: {e}[/red]")
+            report.notes.append(f"RF scan error: {str(e)}")
+            valid_ranges = []
+
+        # Split the sweep back into per-range results
+        for range_name in valid_ranges:
+            freq_min, freq_max = _VALID_RANGES[range_name]
+            rf_scan = _range_scan_info(freqs, peak, freq_min, freq_max, dwell, log)
+            rf_results.append(rf_scan)
+
+            if rf_scan.hot_bins:
+                console.print(f"[green]✅ Found {len(rf_scan.hot_bins)} active frequencies in {range_name}[/green]")
+
+                # Show top signals
+                top_signals = nlargest(3, rf_scan.hot_bins, key=attrgetter('power_db'))
+                for j, signal in enumerate(top_signals, 1):
+                    freq_desc = _get_frequency_description(signal.frequency_hz)
+                    console.print(f"[cyan]    {j}. {signal.frequency_hz/1e6:.3f} MHz: {signal.power_db:.1f} dB ({freq_desc})[/cyan]")
+            else:
+                console.print(f"[dim]⚪ No activity detected in {range_name}[/dim]")
 
         # Add results to report
         report.rf_scans.extend(rf_results)
@@ -173,19 +183,17 @@ async def scan(ctx: ScanContext, report: ScanReport, log) -> None:
             console.print(f"\n[bold green]🎉 RF scan complete: found {total_hot_bins} active frequency bins across {len(rf_results)} ranges[/bold green]")
 
             # Show top findings in a table
-            all_bins = []
-            for scan in rf_results:
-                all_bins.extend(scan.hot_bins)
-            all_bins.sort(key=lambda x: x.power_db, reverse=True)
+            top_bins = nlargest(10, chain.from_iterable(scan.hot_bins for scan in rf_results),
+                                key=attrgetter('power_db'))
 
-            if all_bins:
+            if top_bins:
                 table = Table(title="🔥 Top Active Frequencies")
                 table.add_column("Rank", style="cyan", no_wrap=True)
                 table.add_column("Frequency", style="magenta")
                 table.add_column("Power", style="green")
                 table.add_column("Description", style="yellow")
 
-                for i, bin in enumerate(all_bins[:10]):
+                for i, bin in enumerate(top_bins):
                     freq_desc = _get_frequency_description(bin.frequency_hz)
                     table.add_row(
                         f"{i+1}",
@@ -209,6 +217,15 @@ async def scan(ctx: ScanContext, report: ScanReport, log) -> None:
         report.notes.append(f"HackRF scan error: {str(e)}")
 
 
+def _scan_mode(ctx: ScanContext) -> str:
+    """Pick the _RANGES_BY_MODE entry for a scan context."""
+    if ctx.interactive:
+        return 'interactive'
+    if ctx.target_type in ('ip', 'hostname'):
+        return 'network'
+    return 'default'
+
+
 async def _verify_hackrf_device(log) -> bool:
     """Verify HackRF device is connected and accessible."""
     try:
@@ -235,343 +252,314 @@ async def _verify_hackrf_device(log) -> bool:
         return False
 
 
-async def _scan_frequency_range_with_progress(
-    range_name: str, freq_min: float, freq_max: float,
-    ctx: ScanContext, log, console: Console, current_range: int, total_ranges: int
-) -> Optional[RfScanInfo]:
+# hackrf_sweep accepts at most this many -f ranges per invocation
+MAX_SWEEP_RANGES = 10
+
+
+def _sweep_range_args(ranges: List[Tuple[float, float]]) -> List[str]:
     """
-    Scan a specific frequency range with live progress display and spectrum visualization.
+    Build hackrf_sweep -f arguments for a set of ranges, merging overlapping
+    ones (in whole MHz) and closing the smallest gaps if there are too many.
     """
-    try:
-        # Calculate scan parameters
-        center_freq = (freq_min + freq_max) / 2
-        bandwidth = freq_max - freq_min
+    spans = sorted((int(lo / 1e6), max(int(hi / 1e6), int(lo / 1e6) + 1)) for lo, hi in ranges)
+    merged = [list(spans[0])]
+    for lo, hi in spans[1:]:
+        if lo <= merged[-1][1]:
+            merged[-1][1] = max(merged[-1][1], hi)
+        else:
+            merged.append([lo, hi])
 
-        # Scan duration
-        scan_duration = 3.0 if ctx.interactive else 8.0
+    while len(merged) > MAX_SWEEP_RANGES:
+        i = min(range(len(merged) - 1), key=lambda k: merged[k + 1][0] - merged[k][1])
+        merged[i][1] = max(merged[i][1], merged[i + 1][1])
+        del merged[i + 1]
 
-        # Use hackrf_sweep for wide spectrum scanning
-        freq_min_mhz = int(freq_min / 1e6)
-        freq_max_mhz = int(freq_max / 1e6)
+    args = []
+    for lo, hi in merged:
+        args += ['-f', f"{lo}:{hi}"]
+    return args
 
-        # Create temporary file for sweep output
-        with tempfile.NamedTemporaryFile(mode='w+', suffix='.csv', delete=False) as temp_file:
-            temp_filename = temp_file.name
 
+async def _sweep_with_progress(
+    ranges: List[Tuple[float, float]], scan_duration: float, log, console: Console
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Run a single hackrf_sweep over all ranges with live progress display and
+    spectrum visualization. Returns sorted frequencies and their peak power.
+    """
+    sweep_min = min(lo for lo, _ in ranges)
+    sweep_max = max(hi for _, hi in ranges)
+
+    # Run hackrf_sweep with live progress; binary records are read straight from stdout
+    cmd = [
+        'hackrf_sweep',
+        '-B',             # binary output
+        *_sweep_range_args(ranges),
+        '-w', str(int(SWEEP_BIN_HZ)),  # 1 MHz step size for wide scan
+        '-l', '32',       # LNA gain
+        '-g', '30',       # VGA gain
+        '-a', '1',        # Enable antenna power
+    ]
+
+    process = await asyncio.create_subprocess_exec(
+        *cmd,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.DEVNULL  # per-second sweep stats we don't use
+    )
+
+    # Records are buffered as they arrive and folded into a dense per-MHz
+    # peak-power array at each spectrum update
+    pending_records = []
+    origin_hz = np.floor(sweep_min / SWEEP_BIN_HZ) * SWEEP_BIN_HZ
+    peak_acc = np.full(int((sweep_max - origin_hz) // SWEEP_BIN_HZ) + 1, -np.inf)
+
+    # This pipe read is the main beneficiary of uvloop when it is
+    # installed (see fingerprinter.__main__)
+    async def _read_records():
         try:
-            # Run hackrf_sweep with live progress
-            cmd = [
-                'hackrf_sweep',
-                '-f', f"{freq_min_mhz}:{freq_max_mhz}",
-                '-w', '1000000',  # 1 MHz step size for wide scan
-                '-l', '32',       # LNA gain
-                '-g', '30',       # VGA gain
-                '-a', '1',        # Enable antenna power
-                '-r', temp_filename
-            ]
+            while True:
+                prefix = await process.stdout.readexactly(_SWEEP_RECORD_LEN.size)
+                (record_len,) = _SWEEP_RECORD_LEN.unpack(prefix)
+                pending_records.append(await process.stdout.readexactly(record_len))
+        except asyncio.IncompleteReadError:
+            pass  # sweep ended, possibly mid-record
+
+    reader = asyncio.create_task(_read_records())
+
+    def _fold_pending():
+        if pending_records:
+            new_freqs, new_powers = _sweep_records_to_arrays(pending_records)
+            pending_records.clear()
+            _accumulate_peaks(peak_acc, origin_hz, new_freqs, new_powers, sweep_min, sweep_max)
+        return _binned_spectrum(peak_acc, origin_hz)
 
-            process = await asyncio.create_subprocess_exec(
-                *cmd,
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE
-            )
+    try:
+        # Monitor the scan with simple progress updates
+        start_time = time.time()
+        last_update = 0
+        last_progress_shown = -1
 
-            # Monitor the scan with simple progress updates
-            start_time = time.time()
-            last_update = 0
-            last_progress_shown = -1
-
-            console.print(f"    [dim]⏳ Starting {scan_duration:.1f}s scan...[/dim]")
-
-            while process.returncode is None:
-                # Check if process is still running
-                try:
-                    await asyncio.wait_for(process.wait(), timeout=0.5)
-                    break
-                except asyncio.TimeoutError:
-                    pass
-
-                elapsed = time.time() - start_time
-                if elapsed >= scan_duration:
-                    process.terminate()
-                    await process.wait()
-                    break
-
-                # Show progress every 20%
-                progress_percent = min((elapsed / scan_duration) * 100, 100)
-                progress_step = int(progress_percent // 20) * 20
-
-                if progress_step > last_progress_shown and progress_step > 0:
-                    # Create simple progress bar
-                    bar_width = 30
-                    filled = int((progress_percent / 100) * bar_width)
-                    bar = "█" * filled + "░" * (bar_width - filled)
-                    console.print(f"    [blue]Progress: {progress_percent:5.1f}% [{bar}] ({elapsed:.1f}s)[/blue]")
-                    last_progress_shown = progress_step
-
-                # Show spectrum updates every 2 seconds
-                if elapsed - last_update >= 2.0:
-                    spectrum_data = await _get_live_spectrum_data(temp_filename, freq_min, freq_max)
-                    if spectrum_data.get('hot_bins'):
-                        # Show spectrum visualization
-                        ascii_spectrum = _create_ascii_spectrum(spectrum_data)
-                        console.print(f"    {ascii_spectrum}")
-                        hot_count = len(spectrum_data['hot_bins'])
-                        console.print(f"    [green]🔥 {hot_count} active signals detected[/green]")
-                    else:
-                        # Show basic spectrum visualization
-                        ascii_spectrum = _create_ascii_spectrum({'frequency_powers': {}})
-                        console.print(f"    {ascii_spectrum}")
-                    last_update = elapsed
-
-            # Final progress
-            console.print(f"    [green]✓ Scan completed in {time.time() - start_time:.1f}s[/green]")
-
-            # Read and parse the final sweep data
-            hot_bins = await _parse_sweep_data(temp_filename, freq_min, freq_max, log)
-
-            # Calculate statistics
-            if hot_bins:
-                powers = [bin.power_db for bin in hot_bins]
-                noise_floor = min(powers) if powers else -80.0
-                detection_threshold = noise_floor + 15.0
-            else:
-                noise_floor = -80.0
-                detection_threshold = -65.0
-
-            return RfScanInfo(
-                center_freq_hz=center_freq,
-                sample_rate_hz=DEFAULT_SAMPLE_RATE,
-                bandwidth_hz=bandwidth,
-                gain_db=30,
-                hot_bins=hot_bins,
-                scan_duration_sec=scan_duration,
-                total_samples=0,  # Not applicable for sweep mode
-                noise_floor_db=noise_floor,
-                detection_threshold_db=detection_threshold
-            )
+        console.print(f"    [dim]⏳ Starting {scan_duration:.1f}s scan...[/dim]")
 
-        finally:
-            # Clean up temporary file
+        while process.returncode is None:
+            # Check if process is still running
             try:
-                os.unlink(temp_filename)
-            except:
+                await asyncio.wait_for(process.wait(), timeout=0.5)
+                break
+            except asyncio.TimeoutError:
                 pass
 
-    except Exception as e:
-        log.error(f"Error scanning frequency range {range_name}: {e}")
-        return None
-
+            elapsed = time.time() - start_time
+            if elapsed >= scan_duration:
+                process.terminate()
+                await process.wait()
+                break
+
+            # Show progress every 20%
+            progress_percent = min((elapsed / scan_duration) * 100, 100)
+            progress_step = int(progress_percent // 20) * 20
+
+            if progress_step > last_progress_shown and progress_step > 0:
+                # Create simple progress bar
+                bar_width = 30
+                filled = int((progress_percent / 100) * bar_width)
+                bar = "█" * filled + "░" * (bar_width - filled)
+                console.print(f"    [blue]Progress: {progress_percent:5.1f}% [{bar}] ({elapsed:.1f}s)[/blue]")
+                last_progress_shown = progress_step
+
+            # Show spectrum updates every 2 seconds
+            if elapsed - last_update >= 2.0:
+                spectrum_data = _live_spectrum_data(*_fold_pending())
+                if spectrum_data.get('hot_bins'):
+                    # Show spectrum visualization
+                    ascii_spectrum = _create_ascii_spectrum(spectrum_data)
+                    console.print(f"    {ascii_spectrum}")
+                    hot_count = len(spectrum_data['hot_bins'])
+                    console.print(f"    [green]🔥 {hot_count} active signals detected[/green]")
+                else:
+                    # Show basic spectrum visualization
+                    ascii_spectrum = _create_ascii_spectrum({})
+                    console.print(f"    {ascii_spectrum}")
+                last_update = elapsed
+
+        # Drain whatever the sweep wrote before exiting
+        await reader
+
+    finally:
+        if process.returncode is None:
+            process.kill()
+            await process.wait()
+        reader.cancel()
+
+    # Final progress
+    console.print(f"    [green]✓ Scan completed in {time.time() - start_time:.1f}s[/green]")
+
+    return _fold_pending()
+
+
+def _range_scan_info(freqs: np.ndarray, peak: np.ndarray, freq_min: float, freq_max: float,
+                     scan_duration: float, log) -> RfScanInfo:
+    """Build the RfScanInfo for one range out of a (possibly wider) sweep."""
+    # freqs is sorted, so the range is one contiguous slice
+    lo = np.searchsorted(freqs, freq_min, side='left')
+    hi = np.searchsorted(freqs, freq_max, side='right')
+    hot_bins = _detect_hot_bins(freqs[lo:hi], peak[lo:hi], log)
+
+    # Calculate statistics
+    if hot_bins:
+        powers = [bin.power_db for bin in hot_bins]
+        noise_floor = min(powers) if powers else -80.0
+        detection_threshold = noise_floor + 15.0
+    else:
+        noise_floor = -80.0
+        detection_threshold = -65.0
+
+    return RfScanInfo(
+        center_freq_hz=(freq_min + freq_max) / 2,
+        sample_rate_hz=DEFAULT_SAMPLE_RATE,
+        bandwidth_hz=freq_max - freq_min,
+        gain_db=30,
+        hot_bins=hot_bins,
+        scan_duration_sec=scan_duration,
+        total_samples=0,  # Not applicable for sweep mode
+        noise_floor_db=noise_floor,
+        detection_threshold_db=detection_threshold
+    )
 
 
+# Bar glyphs by normalized power, and Rich styles by power band (<=.2, <=.4, <=.6, <=.8, >.8)
+_SPECTRUM_CHARS = np.array(["▁", "▂", "▃", "▄", "▅", "▆", "▇", "█"])
+_SPECTRUM_STYLES = np.array(["dim", "green", "yellow", "red", "bold red"])
+_SPECTRUM_STYLE_EDGES = np.array([0.2, 0.4, 0.6, 0.8])
+_SPECTRUM_WIDTH = 50
 
 
 def _create_ascii_spectrum(spectrum_data: dict) -> str:
     """Create ASCII art spectrum visualization."""
-    if not spectrum_data or not spectrum_data.get('frequency_powers'):
+    powers = spectrum_data.get('power_db') if spectrum_data else None
+    if powers is None or not len(powers):
         # Default spectrum when no data
-        return "[dim]🎵 " + "▁" * 50 + " [/dim]"
+        return "[dim]🎵 " + "▁" * _SPECTRUM_WIDTH + " [/dim]"
 
-    frequency_powers = spectrum_data['frequency_powers']
+    # Normalize power values for display (powers are ordered by frequency)
+    min_power = powers.min()
+    power_range = (powers.max() - min_power) or 1
 
-    # Convert to ASCII bars
-    if not frequency_powers:
-        return "[dim]🎵 " + "▁" * 50 + " [/dim]"
+    # Downsample to the display width
+    if len(powers) > _SPECTRUM_WIDTH:
+        powers = powers[np.arange(_SPECTRUM_WIDTH) * (len(powers) // _SPECTRUM_WIDTH)]
 
-    # Normalize power values for display
-    powers = list(frequency_powers.values())
-    if not powers:
-        return "[dim]🎵 " + "▁" * 50 + " [/dim]"
-
-    min_power = min(powers)
-    max_power = max(powers)
-    power_range = max_power - min_power if max_power != min_power else 1
-
-    # Create ASCII spectrum
-    spectrum_chars = ["▁", "▂", "▃", "▄", "▅", "▆", "▇", "█"]
-    spectrum_width = 50
-
-    # Sample frequencies for display
-    freq_list = sorted(frequency_powers.keys())
-    if len(freq_list) > spectrum_width:
-        # Downsample for display
-        step = len(freq_list) // spectrum_width
-        sampled_freqs = [freq_list[i * step] for i in range(spectrum_width)]
-    else:
-        # Pad with empty if not enough frequencies
-        sampled_freqs = freq_list + [None] * (spectrum_width - len(freq_list))
-
-    ascii_bars = []
-    for freq in sampled_freqs[:spectrum_width]:
-        if freq and freq in frequency_powers:
-            power = frequency_powers[freq]
-            normalized = (power - min_power) / power_range
-            char_index = min(int(normalized * len(spectrum_chars)), len(spectrum_chars) - 1)
-            char = spectrum_chars[char_index]
-
-            # Color based on power level
-            if normalized > 0.8:
-                ascii_bars.append(f"[bold red]{char}[/bold red]")
-            elif normalized > 0.6:
-                ascii_bars.append(f"[red]{char}[/red]")
-            elif normalized > 0.4:
-                ascii_bars.append(f"[yellow]{char}[/yellow]")
-            elif normalized > 0.2:
-                ascii_bars.append(f"[green]{char}[/green]")
-            else:
-                ascii_bars.append(f"[dim]{char}[/dim]")
-        else:
-            ascii_bars.append("[dim]▁[/dim]")
-
-    return "🎵 " + "".join(ascii_bars) + " 🎵"
+    normalized = (powers - min_power) / power_range
+    chars = _SPECTRUM_CHARS[np.minimum((normalized * len(_SPECTRUM_CHARS)).astype(int), len(_SPECTRUM_CHARS) - 1)]
+    styles = _SPECTRUM_STYLES[np.digitize(normalized, _SPECTRUM_STYLE_EDGES, right=True)]
 
+    # Color based on power level; pad with empty bars if not enough frequencies
+    ascii_bars = "".join(f"[{style}]{char}[/{style}]" for style, char in zip(styles.tolist(), chars.tolist()))
+    ascii_bars += "[dim]▁[/dim]" * (_SPECTRUM_WIDTH - len(powers))
 
-async def _get_live_spectrum_data(filename: str, freq_min: float, freq_max: float) -> dict:
-    """Get current spectrum data from the sweep file."""
-    try:
-        if not os.path.exists(filename) or os.path.getsize(filename) == 0:
-            return {'frequency_powers': {}, 'hot_bins': []}
+    return "🎵 " + ascii_bars + " 🎵"
 
-        # Read current data
-        frequency_powers = {}
-        with open(filename, 'r') as f:
-            lines = f.readlines()
 
-        for line in lines[-50:]:  # Only look at recent data
-            line = line.strip()
-            if not line or line.startswith('#') or line.startswith('date'):
-                continue
+# hackrf_sweep -B framing: uint32 record length, then uint64 hz_low and
+# uint64 hz_high followed by one float32 dB value per FFT bin
+_SWEEP_RECORD_LEN = struct.Struct('<I')
+_SWEEP_RECORD_HEADER = struct.Struct('<QQ')
 
-            parts = line.split(',')
-            if len(parts) < 4:
-                continue
 
-            try:
-                freq_hz = float(parts[2])
-                power_db = float(parts[3])
-
-                if freq_min <= freq_hz <= freq_max:
-                    frequency_powers[freq_hz] = max(frequency_powers.get(freq_hz, -100), power_db)
-            except (ValueError, IndexError):
-                continue
-
-        # Identify hot bins
-        if frequency_powers:
-            powers = list(frequency_powers.values())
-            noise_floor = np.percentile(powers, 25) if len(powers) > 4 else min(powers)
-            threshold = noise_floor + 12
-
-            hot_bins = []
-            for freq_hz, power_db in frequency_powers.items():
-                if power_db > threshold:
-                    hot_bins.append({
-                        'frequency_hz': freq_hz,
-                        'power_db': power_db
-                    })
-
-            return {
-                'frequency_powers': frequency_powers,
-                'hot_bins': hot_bins,
-                'noise_floor': noise_floor,
-                'threshold': threshold
-            }
-
-        return {'frequency_powers': {}, 'hot_bins': []}
-
-    except Exception:
-        return {'frequency_powers': {}, 'hot_bins': []}
-
-
-async def _parse_sweep_data(filename: str, freq_min: float, freq_max: float, log) -> List[FrequencyBin]:
+def _sweep_records_to_arrays(records) -> Tuple[np.ndarray, np.ndarray]:
     """
-    Parse hackrf_sweep CSV output and identify hot bins.
+    Parse hackrf_sweep binary records into flat (frequency_hz, power_db) arrays.
+
+    Each record covers hz_low..hz_high with equally wide bins starting at hz_low.
     """
-    hot_bins = []
+    freqs, powers = [], []
+    for record in records:
+        if len(record) <= _SWEEP_RECORD_HEADER.size:
+            continue
+        hz_low, hz_high = _SWEEP_RECORD_HEADER.unpack_from(record)
+        bins = np.frombuffer(record, dtype='<f4', offset=_SWEEP_RECORD_HEADER.size,
+                             count=(len(record) - _SWEEP_RECORD_HEADER.size) // 4)
+        freqs.append(hz_low + (np.arange(bins.size) + 0.5) * ((hz_high - hz_low) / bins.size))
+        powers.append(bins)
 
-    try:
-        if not os.path.exists(filename) or os.path.getsize(filename) == 0:
-            log.warning("Sweep data file is empty or missing")
-            return hot_bins
+    if not powers:
+        return np.empty(0), np.empty(0)
+    return np.concatenate(freqs), np.concatenate(powers)
 
-        # Read sweep data
-        with open(filename, 'r') as f:
-            lines = f.readlines()
 
-        if len(lines) < 2:
-            log.warning("Insufficient sweep data")
-            return hot_bins
+def _accumulate_peaks(peak_acc: np.ndarray, origin_hz: float, freqs: np.ndarray, powers: np.ndarray,
+                      freq_min: float, freq_max: float) -> None:
+    """Fold (frequency, power) samples into a per-bin running maximum, in place."""
+    mask = (freqs >= freq_min) & (freqs <= freq_max) & ~np.isnan(powers)
+    idx = ((freqs[mask] - origin_hz) // SWEEP_BIN_HZ).astype(np.intp)
+    np.maximum.at(peak_acc, idx, powers[mask])
 
-        # Parse CSV data (hackrf_sweep format: date, time, freq_hz, power_db, ...)
-        frequency_powers = {}
 
-        for line in lines:
-            line = line.strip()
-            if not line or line.startswith('#') or line.startswith('date'):
-                continue
+def _binned_spectrum(peak_acc: np.ndarray, origin_hz: float) -> Tuple[np.ndarray, np.ndarray]:
+    """Centre frequencies and peak powers of the bins that have seen data."""
+    seen = np.flatnonzero(peak_acc > -np.inf)
+    return origin_hz + (seen + 0.5) * SWEEP_BIN_HZ, peak_acc[seen]
 
-            parts = line.split(',')
-            if len(parts) < 4:
-                continue
 
-            try:
-                freq_hz = float(parts[2])
-                power_db = float(parts[3])
-
-                # Only consider frequencies in our target range
-                if freq_min <= freq_hz <= freq_max:
-                    # Keep track of maximum power seen at each frequency
-                    if freq_hz not in frequency_powers or power_db > frequency_powers[freq_hz]:
-                        frequency_powers[freq_hz] = power_db
-            except (ValueError, IndexError):
-                continue
-
-        if not frequency_powers:
-            log.debug("No valid frequency data found in sweep")
-            return hot_bins
-
-        # Calculate noise floor and threshold
-        powers = list(frequency_powers.values())
-        noise_floor = np.percentile(powers, 25)  # 25th percentile
-        threshold = noise_floor + 12  # 12 dB above noise floor
-
-        log.debug(f"Noise floor: {noise_floor:.1f} dB, Detection threshold: {threshold:.1f} dB")
-
-        # Identify hot bins (frequencies with power above threshold)
-        for freq_hz, power_db in frequency_powers.items():
-            if power_db > threshold:
-                hot_bin = FrequencyBin(
-                    frequency_hz=freq_hz,
-                    power_db=power_db,
-                    bandwidth_hz=1e6,  # 1 MHz resolution from sweep
-                    detection_method="hackrf_sweep",
-                    timestamp=datetime.utcnow()
-                )
-                hot_bins.append(hot_bin)
-
-        # Sort by power (strongest first) and limit results
-        hot_bins.sort(key=lambda x: x.power_db, reverse=True)
-        if len(hot_bins) > 25:  # Limit to top 25 signals
-            hot_bins = hot_bins[:25]
-
-        log.debug(f"Identified {len(hot_bins)} hot bins above {threshold:.1f} dB")
+def _live_spectrum_data(freqs: np.ndarray, peak: np.ndarray) -> dict:
+    """Summarize the spectrum seen so far for the live display."""
+    if not freqs.size:
+        return {'frequency_hz': freqs, 'power_db': peak, 'hot_bins': []}
 
-    except Exception as e:
-        log.error(f"Error parsing sweep data: {e}")
+    # Identify hot bins
+    noise_floor = np.percentile(peak, 25) if peak.size > 4 else peak.min()
+    threshold = noise_floor + 12
 
-    return hot_bins
+    hot = peak > threshold
+    hot_bins = [
+        {'frequency_hz': freq_hz, 'power_db': power_db}
+        for freq_hz, power_db in zip(freqs[hot].tolist(), peak[hot].tolist())
+    ]
 
+    return {
+        'frequency_hz': freqs,
+        'power_db': peak,
+        'hot_bins': hot_bins,
+        'noise_floor': noise_floor,
+        'threshold': threshold
+    }
 
-async def _scan_frequency_range(
-    range_name: str, freq_min: float, freq_max: float,
-    ctx: ScanContext, log
-) -> Optional[RfScanInfo]:
+
+def _detect_hot_bins(freqs: np.ndarray, peak: np.ndarray, log) -> List[FrequencyBin]:
     """
-    Original scan function without progress display (for backward compatibility).
+    Identify hot bins from per-frequency peak powers of a sweep.
     """
-    console = Console()
-    return await _scan_frequency_range_with_progress(
-        range_name, freq_min, freq_max, ctx, log, console, 1, 1
-    )
+    hot_bins = []
+
+    if not freqs.size:
+        log.debug("No valid frequency data found in sweep")
+        return hot_bins
+
+    # Calculate noise floor and threshold
+    noise_floor = np.percentile(peak, 25)  # 25th percentile
+    threshold = noise_floor + 12  # 12 dB above noise floor
+
+    log.debug(f"Noise floor: {noise_floor:.1f} dB, Detection threshold: {threshold:.1f} dB")
+
+    # Identify hot bins (frequencies with power above threshold),
+    # strongest first and limited to the top 25 signals
+    hot = np.flatnonzero(peak > threshold)
+    hot = hot[np.argsort(-peak[hot], kind='stable')[:25]]
+
+    # All bins from one sweep share its timestamp
+    sweep_ts = datetime.utcnow()
+    for freq_hz, power_db in zip(freqs[hot].tolist(), peak[hot].tolist()):
+        hot_bins.append(FrequencyBin(
+            frequency_hz=freq_hz,
+            power_db=power_db,
+            bandwidth_hz=SWEEP_BIN_HZ,  # 1 MHz resolution from sweep
+            detection_method="hackrf_sweep",
+            timestamp=sweep_ts
+        ))
+
+    log.debug(f"Identified {len(hot_bins)} hot bins above {threshold:.1f} dB")
+
+    return hot_bins
 
 
 async def _collect_iq_samples(center_freq: float, sample_rate: float, duration: float, log) -> Optional[np.ndarray]:
@@ -611,11 +599,12 @@ async def _collect_iq_samples(center_freq: float, sample_rate: float, duration:
                 with open(temp_filename, 'rb') as f:
                     raw_data = f.read()
 
-                # Convert to complex IQ samples
+                # Convert interleaved int8 I/Q pairs to complex64 in one pass,
+                # writing straight into the complex array's float32 view
                 samples = np.frombuffer(raw_data, dtype=np.int8)
-                i_samples = samples[0::2].astype(np.float32) / 128.0
-                q_samples = samples[1::2].astype(np.float32) / 128.0
-                iq_samples = i_samples + 1j * q_samples
+                pairs = samples[:samples.size & ~1].reshape(-1, 2)
+                iq_samples = np.empty(len(pairs), dtype=np.complex64)
+                np.multiply(pairs, np.float32(1.0 / 128.0), out=iq_samples.view(np.float32).reshape(-1, 2))
 
                 log.debug(f"Collected {len(iq_samples)} IQ samples")
                 return iq_samples
@@ -632,65 +621,56 @@ async def _collect_iq_samples(center_freq: float, sample_rate: float, duration:
     return None
 
 
-def _get_frequency_description(freq_hz: float) -> str:
-    """
-    Get a human-readable description of what might be using a frequency.
-    """
-    freq_mhz = freq_hz / 1e6
-
-    # WiFi channels
-    if 2400 <= freq_mhz <= 2500:
-        if 2412 <= freq_mhz <= 2484:
-            channel = int((freq_mhz - 2412) / 5) + 1
-            if channel <= 13:
-                return f"WiFi Channel {channel}"
-        return "WiFi 2.4GHz"
-
-    if 5150 <= freq_mhz <= 5875:
-        if 5170 <= freq_mhz <= 5330:
-            return "WiFi 5GHz (Lower)"
-        elif 5490 <= freq_mhz <= 5710:
-            return "WiFi 5GHz (Middle)"
-        elif 5735 <= freq_mhz <= 5875:
-            return "WiFi 5GHz (Upper)"
-        return "WiFi 5GHz"
-
-    # Bluetooth
-    if 2402 <= freq_mhz <= 2480:
-        return "Bluetooth"
-
-    # ISM bands
-    if 433.05 <= freq_mhz <= 434.79:
-        return "433MHz IoT Device"
-
-    if 863 <= freq_mhz <= 870:
-        return "868MHz IoT Device (EU)"
-
-    if 902 <= freq_mhz <= 928:
-        return "915MHz IoT Device (US)"
+def _closed(lo_mhz: float, hi_mhz: float, label: str) -> Tuple[float, float, str]:
+    """A band including both edges, as a half-open [lo, hi) interval."""
+    return lo_mhz, math.nextafter(hi_mhz, math.inf), label
+
+
+# Frequency bands as half-open [lo_mhz, hi_mhz) intervals, in priority order:
+# the first band containing a frequency names it. 2.4 GHz WiFi covers the
+# Bluetooth band, so Bluetooth is never reported separately.
+_FREQUENCY_BANDS = (
+    *((2412 + 5 * (ch - 1), 2412 + 5 * ch, f"WiFi Channel {ch}") for ch in range(1, 14)),
+    _closed(2400, 2500, "WiFi 2.4GHz"),
+    _closed(5170, 5330, "WiFi 5GHz (Lower)"),
+    _closed(5490, 5710, "WiFi 5GHz (Middle)"),
+    _closed(5735, 5875, "WiFi 5GHz (Upper)"),
+    _closed(5150, 5875, "WiFi 5GHz"),
+    _closed(433.05, 434.79, "433MHz IoT Device"),
+    _closed(863, 870, "868MHz IoT Device (EU)"),
+    _closed(902, 928, "915MHz IoT Device (US)"),
+    _closed(698, 798, "LTE Band 12/13/14/17"),
+    _closed(824, 894, "LTE Band 5 (850MHz)"),
+    _closed(1850, 1990, "LTE Band 2/25 (1900MHz)"),
+    _closed(880, 960, "GSM 900"),
+    _closed(1710, 1880, "DCS 1800"),
+    # Generic frequency ranges
+    (-math.inf, 30, "HF"),
+    (30, 300, "VHF"),
+    (300, 3000, "UHF"),
+    (3000, math.inf, "Microwave"),
+)
 
-    # Cellular
-    if 698 <= freq_mhz <= 798:
-        return "LTE Band 12/13/14/17"
 
-    if 824 <= freq_mhz <= 894:
-        return "LTE Band 5 (850MHz)"
+def _flatten_bands(bands) -> Tuple[List[float], List[str]]:
+    """
+    Resolve overlapping prioritized bands into sorted, non-overlapping segment
+    starts and labels, so a lookup is a single bisect.
+    """
+    starts, labels = [], []
+    for edge in sorted({e for lo, hi, _ in bands for e in (lo, hi)} - {math.inf}):
+        label = next(label for lo, hi, label in bands if lo <= edge < hi)
+        if not labels or labels[-1] != label:
+            starts.append(edge)
+            labels.append(label)
+    return starts, labels
 
-    if 1850 <= freq_mhz <= 1990:
-        return "LTE Band 2/25 (1900MHz)"
 
-    if 880 <= freq_mhz <= 960:
-        return "GSM 900"
+_BAND_STARTS, _BAND_LABELS = _flatten_bands(_FREQUENCY_BANDS)
 
-    if 1710 <= freq_mhz <= 1880:
-        return "DCS 1800"
 
-    # Generic frequency ranges
-    if freq_mhz < 30:
-        return "HF"
-    elif freq_mhz < 300:
-        return "VHF"
-    elif freq_mhz < 3000:
-        return "UHF"
-    else:
-        return "Microwave"
+def _get_frequency_description(freq_hz: float) -> str:
+    """
+    Get a human-readable description of what might be using a frequency.
+    """
+    return _BAND_LABELS[bisect_right(_BAND_STARTS, freq_hz / 1e6) - 1]
@@ -1,10 +1,148 @@
 import asyncio
 import aiohttp
 import re
+from operator import itemgetter
 from typing import List, Dict, Any
 from fingerprinter.core.context import ScanContext
 from fingerprinter.core.result import ScanReport, HttpInfo
 
+# Only the start of each body is fingerprinted
+MAX_BODY_BYTES = 10000
+
+# Ports probed at once on a single target
+MAX_CONCURRENT_REQUESTS = 4
+
+# Upper bound on signatures reported per URL; scanning stops once it is reached
+MAX_SIGNATURES = 64
+
+_TITLE_RE = re.compile(r'<title[^>]*>(.*?)</title>', re.IGNORECASE | re.DOTALL)
+_GENERATOR_RE = re.compile(r'<meta[^>]+name=["\']generator["\'][^>]+content=["\']([^"\']+)["\']', re.IGNORECASE)
+
+# Common CMS/Framework signatures
+_CONTENT_SIGNATURES = (
+    ('wordpress', 'WordPress'),
+    ('wp-content', 'WordPress'),
+    ('wp-includes', 'WordPress'),
+    ('drupal', 'Drupal'),
+    ('joomla', 'Joomla'),
+    ('powered by django', 'Django'),
+    ('angular', 'AngularJS'),
+    ('react', 'React'),
+    ('vue.js', 'Vue.js'),
+    ('bootstrap', 'Bootstrap'),
+    ('jquery', 'jQuery'),
+    ('nginx', 'nginx'),
+    ('apache', 'Apache'),
+    ('lighttpd', 'lighttpd'),
+    ('microsoft-iis', 'IIS'),
+    ('tomcat', 'Apache Tomcat'),
+    ('jetty', 'Jetty'),
+    ('express', 'Express.js'),
+    ('flask', 'Flask'),
+    ('rails', 'Ruby on Rails'),
+    ('laravel', 'Laravel'),
+    ('symfony', 'Symfony'),
+)
+
+# Google/Nest WiFi signatures
+_GOOGLE_PATTERNS = (
+    ('google wifi', 'Google WiFi'),
+    ('nest wifi', 'Nest WiFi'),
+    ('onhub', 'OnHub'),
+    ('google nest', 'Google Nest'),
+    ('made by google', 'Google Device'),
+)
+
+# Router signatures
+_ROUTER_PATTERNS = (
+    ('linksys', 'Linksys Router'),
+    ('netgear', 'Netgear Router'),
+    ('d-link', 'D-Link Router'),
+    ('tp-link', 'TP-Link Router'),
+    ('asus', 'ASUS Router'),
+    ('belkin', 'Belkin Router'),
+    ('buffalo', 'Buffalo Router'),
+    ('zyxel', 'ZyXEL Router'),
+    ('ubiquiti', 'Ubiquiti Device'),
+    ('mikrotik', 'MikroTik Router'),
+    ('openwrt', 'OpenWrt'),
+    ('dd-wrt', 'DD-WRT'),
+    ('tomato', 'Tomato Firmware'),
+    ('pfsense', 'pfSense'),
+    ('router', 'Generic Router'),
+    ('access point', 'Access Point'),
+    ('wireless', 'Wireless Device'),
+)
+
+# Device management interface signatures
+_MGMT_PATTERNS = (
+    ('web management', 'Web Management Interface'),
+    ('configuration', 'Configuration Interface'),
+    ('admin panel', 'Admin Panel'),
+    ('device manager', 'Device Manager'),
+    ('network settings', 'Network Settings'),
+    ('wireless settings', 'Wireless Settings'),
+)
+
+# Specific technology patterns. These are matched against the lowercased content
+# instead of with re.IGNORECASE, which keeps re's fast literal search
+_TECH_PATTERNS = [(re.compile(pattern.lower()), name) for pattern, name in [
+    (r'wp-json/wp/v2', 'WordPress REST API'),
+    (r'/wp-admin/', 'WordPress Admin'),
+    (r'/administrator/', 'Joomla Admin'),
+    (r'/typo3/', 'TYPO3'),
+    (r'Powered by.*?OpenCart', 'OpenCart'),
+    (r'Magento', 'Magento'),
+    (r'PrestaShop', 'PrestaShop'),
+    (r'phpMyAdmin', 'phpMyAdmin'),
+    (r'cPanel', 'cPanel'),
+    (r'Plesk', 'Plesk'),
+    (r'DirectAdmin', 'DirectAdmin'),
+    (r'ISPConfig', 'ISPConfig'),
+]]
+
+# Client session shared by every HTTP scan on the running event loop, so its
+# connection pool and DNS cache outlive a single target; see close()
+_session: aiohttp.ClientSession | None = None
+_session_loop: asyncio.AbstractEventLoop | None = None
+
+
+def _get_session() -> aiohttp.ClientSession:
+    """Return the shared client session, creating it on first use."""
+    global _session, _session_loop
+
+    loop = asyncio.get_running_loop()
+    if _session is not None and not _session.closed and _session_loop is not loop:
+        # Its connections can only be closed on the loop that opened them
+        raise RuntimeError("HTTP session is still open on another event loop; "
+                           "await close_scanners() before that loop exits")
+
+    if _session is None or _session.closed:
+        connector = aiohttp.TCPConnector(
+            limit=128,
+            use_dns_cache=True,
+            ttl_dns_cache=300,
+            ssl=False  # Don't verify SSL certificates
+        )
+        _session = aiohttp.ClientSession(connector=connector)
+        _session_loop = loop
+
+    return _session
+
+
+async def close() -> None:
+    """Close the shared client session once all scans are done."""
+    global _session, _session_loop
+
+    if _session is None:
+        return
+    if not _session.closed and _session_loop is not asyncio.get_running_loop():
+        raise RuntimeError("HTTP session must be closed on the event loop that created it")
+
+    await _session.close()
+    _session = None
+    _session_loop = None
+
 
 async def scan(ctx: ScanContext, report: ScanReport, log) -> None:
     """
@@ -17,89 +155,99 @@ async def scan(ctx: ScanContext, report: ScanReport, log) -> None:
     https_ports = [443, 8443]
 
     try:
-        # Scan HTTP ports
-        http_tasks = []
-        for port in http_ports:
-            url = f"http://{ctx.ip}:{port}"
-            http_tasks.append(_scan_http_url(url, ctx, log))
-
-        # Scan HTTPS ports
-        for port in https_ports:
-            url = f"https://{ctx.ip}:{port}"
-            http_tasks.append(_scan_http_url(url, ctx, log))
-
-        # Execute all HTTP scans concurrently
-        results = await asyncio.gather(*http_tasks, return_exceptions=True)
-
-        # Process results
-        for result in results:
+        session = _get_session()
+        timeout = aiohttp.ClientTimeout(total=ctx.timeout)
+
+        # Probe a few ports at a time so small devices don't see a burst of connections
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+
+        async def _bounded_scan(index: int, url: str):
+            async with semaphore:
+                return index, await _scan_http_url(session, url, timeout, log)
+
+        urls = [f"http://{ctx.ip}:{port}" for port in http_ports]
+        urls += [f"https://{ctx.ip}:{port}" for port in https_ports]
+
+        # Process results as they arrive; the report keeps port order
+        found = []
+        for next_result in asyncio.as_completed([_bounded_scan(i, url) for i, url in enumerate(urls)]):
+            try:
+                index, result = await next_result
+            except Exception as e:
+                log.debug("HTTP scan exception: %s", e)
+                continue
+
             if isinstance(result, HttpInfo):
-                report.http.append(result)
+                found.append((index, result))
                 log.info(f"HTTP service found: {result.url} [{result.status}] {result.title}")
-            elif isinstance(result, Exception):
-                log.debug(f"HTTP scan exception: {result}")
+
+        report.http.extend(result for _, result in sorted(found, key=itemgetter(0)))
 
         if report.http:
             log.info(f"Found {len(report.http)} HTTP services on {ctx.target}")
         else:
-            log.debug(f"No HTTP services found on {ctx.target}")
+            log.debug("No HTTP services found on %s", ctx.target)
 
     except Exception as e:
         log.error(f"HTTP scan failed for {ctx.target}: {str(e)}")
         report.notes.append(f"HTTP scan error: {str(e)}")
 
 
-async def _scan_http_url(url: str, ctx: ScanContext, log) -> HttpInfo | None:
+async def _scan_http_url(session: aiohttp.ClientSession, url: str,
+                         timeout: aiohttp.ClientTimeout, log) -> HttpInfo | None:
     """
     Scan a single HTTP URL and extract information.
     """
     try:
-        timeout = aiohttp.ClientTimeout(total=ctx.timeout)
+        async with session.get(url, allow_redirects=False, timeout=timeout) as response:
+            log.debug("HTTP response from %s: %s", url, response.status)
 
-        async with aiohttp.ClientSession(timeout=timeout) as session:
-            async with session.get(
-                url,
-                allow_redirects=False,
-                ssl=False  # Don't verify SSL certificates
-            ) as response:
-                log.debug(f"HTTP response from {url}: {response.status}")
-
-                # Read response content (limited)
-                content = ""
+            # Read response content (limited); the rest of the body is never pulled
+            content = ""
+            try:
                 try:
-                    content = await response.text(encoding='utf-8', errors='ignore')
-                    content = content[:10000]  # Limit content size
-                except Exception:
-                    # If we can't read as text, try as bytes
-                    try:
-                        raw_content = await response.read()
-                        content = raw_content[:10000].decode('utf-8', errors='ignore')
-                    except Exception:
-                        content = ""
-
-                # Extract title
-                title = _extract_title(content)
-
-                # Extract signatures/fingerprints
-                signatures = _extract_signatures(response, content)
-
-                return HttpInfo(
-                    url=url,
-                    status=response.status,
-                    title=title,
-                    signatures=signatures
-                )
+                    raw_content = await response.content.readexactly(MAX_BODY_BYTES)
+                except asyncio.IncompleteReadError as e:
+                    raw_content = e.partial  # body shorter than the limit
+                content = raw_content.decode('utf-8', errors='ignore')
+            except Exception:
+                content = ""
+
+            # Plain copy with lowercased names for the worker thread; the first
+            # value of a repeated header wins, as with the multidict's get()
+            headers = {}
+            for name, value in response.headers.items():
+                headers.setdefault(name.lower(), value)
+
+            # Extract title and signatures/fingerprints off the event loop
+            title, signatures = await asyncio.to_thread(
+                _process_response_body, headers, response.status, content
+            )
+
+            return HttpInfo(
+                url=url,
+                status=response.status,
+                title=title,
+                signatures=signatures
+            )
 
     except asyncio.TimeoutError:
-        log.debug(f"HTTP timeout for {url}")
+        log.debug("HTTP timeout for %s", url)
     except aiohttp.ClientConnectorError:
-        log.debug(f"HTTP connection failed for {url}")
+        log.debug("HTTP connection failed for %s", url)
     except Exception as e:
-        log.debug(f"HTTP error for {url}: {e}")
+        log.debug("HTTP error for %s: %s", url, e)
 
     return None
 
 
+def _process_response_body(headers, status: int, content: str) -> tuple[str | None, List[str]]:
+    """
+    Extract the title and signatures of one response. CPU-only, so it runs in a worker thread.
+    """
+    return _extract_title(content), _extract_signatures(headers, status, content, content.lower())
+
+
 def _extract_title(content: str) -> str | None:
     """
     Extract page title from HTML content.
@@ -109,12 +257,10 @@ def _extract_title(content: str) -> str | None:
 
     try:
         # Look for title tag
-        title_match = re.search(r'<title[^>]*>(.*?)</title>', content, re.IGNORECASE | re.DOTALL)
+        title_match = _TITLE_RE.search(content)
         if title_match:
-            title = title_match.group(1).strip()
-            # Clean up title
-            title = re.sub(r'\s+', ' ', title)  # Normalize whitespace
-            title = title[:200]  # Limit length
+            # Clean up title: normalize whitespace and limit length
+            title = ' '.join(title_match.group(1).split())[:200]
             return title if title else None
 
     except Exception:
@@ -123,16 +269,15 @@ def _extract_title(content: str) -> str | None:
     return None
 
 
-def _extract_signatures(response, content: str) -> List[str]:
+def _extract_signatures(headers, status: int, content: str, content_lower: str) -> List[str]:
     """
     Extract technology signatures from HTTP response and content.
     """
     signatures = []
+    seen = set()  # content/technology signatures already added
 
     try:
         # Check HTTP headers for signatures
-        headers = response.headers
-
         # Server header
         server = headers.get('server', '').lower()
         if server:
@@ -156,73 +301,38 @@ def _extract_signatures(response, content: str) -> List[str]:
 
         # Check content for signatures
         if content:
-            content_lower = content.lower()
-
             # Common CMS/Framework signatures
-            content_signatures = [
-                ('wordpress', 'WordPress'),
-                ('wp-content', 'WordPress'),
-                ('wp-includes', 'WordPress'),
-                ('drupal', 'Drupal'),
-                ('joomla', 'Joomla'),
-                ('powered by django', 'Django'),
-                ('angular', 'AngularJS'),
-                ('react', 'React'),
-                ('vue.js', 'Vue.js'),
-                ('bootstrap', 'Bootstrap'),
-                ('jquery', 'jQuery'),
-                ('nginx', 'nginx'),
-                ('apache', 'Apache'),
-                ('lighttpd', 'lighttpd'),
-                ('microsoft-iis', 'IIS'),
-                ('tomcat', 'Apache Tomcat'),
-                ('jetty', 'Jetty'),
-                ('express', 'Express.js'),
-                ('flask', 'Flask'),
-                ('rails', 'Ruby on Rails'),
-                ('laravel', 'Laravel'),
-                ('symfony', 'Symfony'),
-            ]
-
-            for pattern, name in content_signatures:
+            for pattern, name in _CONTENT_SIGNATURES:
+                if len(signatures) >= MAX_SIGNATURES:
+                    break
                 if pattern in content_lower:
                     signature = f"Content: {name}"
-                    if signature not in signatures:
+                    if signature not in seen:
+                        seen.add(signature)
                         signatures.append(signature)
 
             # Look for generator meta tag
-            generator_match = re.search(r'<meta[^>]+name=["\']generator["\'][^>]+content=["\']([^"\']+)["\']', content, re.IGNORECASE)
+            generator_match = _GENERATOR_RE.search(content) if len(signatures) < MAX_SIGNATURES else None
             if generator_match:
                 generator = generator_match.group(1).strip()
                 if generator:
                     signatures.append(f"Generator: {generator}")
 
             # Look for specific technology patterns
-            tech_patterns = [
-                (r'wp-json/wp/v2', 'WordPress REST API'),
-                (r'/wp-admin/', 'WordPress Admin'),
-                (r'/administrator/', 'Joomla Admin'),
-                (r'/typo3/', 'TYPO3'),
-                (r'Powered by.*?OpenCart', 'OpenCart'),
-                (r'Magento', 'Magento'),
-                (r'PrestaShop', 'PrestaShop'),
-                (r'phpMyAdmin', 'phpMyAdmin'),
-                (r'cPanel', 'cPanel'),
-                (r'Plesk', 'Plesk'),
-                (r'DirectAdmin', 'DirectAdmin'),
-                (r'ISPConfig', 'ISPConfig'),
-            ]
-
-            for pattern, name in tech_patterns:
-                if re.search(pattern, content, re.IGNORECASE):
+            for pattern, name in _TECH_PATTERNS:
+                if len(signatures) >= MAX_SIGNATURES:
+                    break
+                if pattern.search(content_lower):
                     signature = f"Technology: {name}"
-                    if signature not in signatures:
+                    if signature not in seen:
+                        seen.add(signature)
                         signatures.append(signature)
 
         # Check for common router/device signatures
-        if response.status == 200:
-            device_signatures = _check_device_signatures(response, content)
-            signatures.extend(device_signatures)
+        remaining = MAX_SIGNATURES - len(signatures)
+        if status == 200 and remaining > 0:
+            device_signatures = _check_device_signatures(headers, content_lower)
+            signatures.extend(device_signatures[:remaining])
 
     except Exception as e:
         # Don't let signature extraction errors break the scan
@@ -231,51 +341,20 @@ def _extract_signatures(response, content: str) -> List[str]:
     return signatures
 
 
-def _check_device_signatures(response, content: str) -> List[str]:
+def _check_device_signatures(headers, content_lower: str) -> List[str]:
     """
-    Check for router and device-specific signatures.
+    Check for router and device-specific signatures in already-lowercased content.
     """
     signatures = []
 
     try:
-        content_lower = content.lower() if content else ""
-        headers = response.headers
-
         # Google/Nest WiFi signatures
-        google_patterns = [
-            ('google wifi', 'Google WiFi'),
-            ('nest wifi', 'Nest WiFi'),
-            ('onhub', 'OnHub'),
-            ('google nest', 'Google Nest'),
-            ('made by google', 'Google Device'),
-        ]
-
-        for pattern, name in google_patterns:
+        for pattern, name in _GOOGLE_PATTERNS:
             if pattern in content_lower:
                 signatures.append(f"Device: {name}")
 
         # Router signatures
-        router_patterns = [
-            ('linksys', 'Linksys Router'),
-            ('netgear', 'Netgear Router'),
-            ('d-link', 'D-Link Router'),
-            ('tp-link', 'TP-Link Router'),
-            ('asus', 'ASUS Router'),
-            ('belkin', 'Belkin Router'),
-            ('buffalo', 'Buffalo Router'),
-            ('zyxel', 'ZyXEL Router'),
-            ('ubiquiti', 'Ubiquiti Device'),
-            ('mikrotik', 'MikroTik Router'),
-            ('openwrt', 'OpenWrt'),
-            ('dd-wrt', 'DD-WRT'),
-            ('tomato', 'Tomato Firmware'),
-            ('pfsense', 'pfSense'),
-            ('router', 'Generic Router'),
-            ('access point', 'Access Point'),
-            ('wireless', 'Wireless Device'),
-        ]
-
-        for pattern, name in router_patterns:
+        for pattern, name in _ROUTER_PATTERNS:
             if pattern in content_lower:
                 signatures.append(f"Device: {name}")
 
@@ -291,16 +370,7 @@ def _check_device_signatures(response, content: str) -> List[str]:
                 signatures.append(f"Header: {desc} ({value})")
 
         # Check for common device management interfaces
-        mgmt_patterns = [
-            ('web management', 'Web Management Interface'),
-            ('configuration', 'Configuration Interface'),
-            ('admin panel', 'Admin Panel'),
-            ('device manager', 'Device Manager'),
-            ('network settings', 'Network Settings'),
-            ('wireless settings', 'Wireless Settings'),
-        ]
-
-        for pattern, name in mgmt_patterns:
+        for pattern, name in _MGMT_PATTERNS:
             if pattern in content_lower:
                 signatures.append(f"Interface: {name}")
 
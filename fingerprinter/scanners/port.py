@@ -1,9 +1,95 @@
 import asyncio
+import re
 import socket
-from typing import List, Optional, Tuple
+import struct
+from operator import itemgetter
+from typing import Optional, Sequence, Tuple
 from fingerprinter.core.context import ScanContext
 from fingerprinter.core.result import ScanReport, PortInfo
 
+# TCP connections open at once on a single target
+MAX_CONCURRENT_CONNECTIONS = 128
+
+_SSH_VER_RE = re.compile(r'ssh-[\d.]+[_-]([^\s\r\n]+)', re.IGNORECASE)
+_HTTP_SERVER_RE = re.compile(r'server:\s*([^\r\n]+)', re.IGNORECASE)
+# Control bytes removed from banners (everything below 0x20 except \t, \n, \r)
+_CONTROL_BYTES = bytes(b for b in range(32) if b not in (9, 10, 13))
+# SO_LINGER on with a zero timeout: close() sends RST and skips TIME_WAIT
+_LINGER_RESET = struct.pack('ii', 1, 0)
+
+# Common ports for Google/Nest WiFi devices and general services
+_COMMON_PORTS = (22, 23, 53, 80, 443, 8080, 8081, 8443, 9000, 50000, 50001)
+# Additional ports for comprehensive (non-interactive) scanning
+_EXTENDED_PORTS = (21, 25, 110, 143, 993, 995, 3389, 5900, 8000, 8888, 9090)
+# UDP ports probed on every scan
+_UDP_PORTS = (53, 67, 68, 123, 161, 500, 4500)
+
+# Common TCP port to service mappings
+_TCP_PORT_SERVICES = {
+    21: "ftp",
+    22: "ssh",
+    23: "telnet",
+    25: "smtp",
+    53: "domain",
+    80: "http",
+    110: "pop3",
+    143: "imap",
+    443: "https",
+    993: "imaps",
+    995: "pop3s",
+    3389: "rdp",
+    5900: "vnc",
+    8000: "http-alt",
+    8080: "http-proxy",
+    8081: "http-alt",
+    8443: "https-alt",
+    8888: "http-alt",
+    9000: "http-alt",
+    9090: "http-alt",
+    50000: "unknown",
+    50001: "unknown"
+}
+
+# Probes sent to elicit a banner on specific TCP ports
+_TCP_PROBES = {
+    21: b"HELP\r\n",                    # FTP
+    22: b"SSH-2.0-Test\r\n",           # SSH
+    23: b"\r\n",                       # Telnet
+    25: b"EHLO test\r\n",              # SMTP
+    53: b"",                           # DNS (no probe needed)
+    80: b"GET / HTTP/1.0\r\n\r\n",     # HTTP
+    110: b"USER test\r\n",             # POP3
+    143: b"A001 CAPABILITY\r\n",       # IMAP
+    443: b"",                          # HTTPS (TLS handshake too complex)
+    993: b"",                          # IMAPS
+    995: b"",                          # POP3S
+}
+
+# TLS-only ports: the server waits for a ClientHello, so there is no banner to read
+_TLS_PORTS = frozenset({443, 993, 995})
+
+# Common UDP port to service mappings
+_UDP_PORT_SERVICES = {
+    53: "domain",
+    67: "dhcps",
+    68: "dhcpc",
+    123: "ntp",
+    161: "snmp",
+    500: "isakmp",
+    4500: "ipsec-nat-t"
+}
+
+# Payloads sent to elicit a response on specific UDP ports
+_UDP_PROBES = {
+    53: b"\x12\x34\x01\x00\x00\x01\x00\x00\x00\x00\x00\x00\x03www\x06google\x03com\x00\x00\x01\x00\x01",  # DNS query
+    67: b"",   # DHCP
+    68: b"",   # DHCP
+    123: b"\x1b" + b"\x00" * 47,  # NTP
+    161: b"\x30\x26\x02\x01\x01\x04\x06public\xa0\x19\x02\x04\x00\x00\x00\x00\x02\x01\x00\x02\x01\x00\x30\x0b\x30\x09\x06\x05\x2b\x06\x01\x02\x01\x05\x00",  # SNMP
+    500: b"",  # IKE
+    4500: b"",  # IPSec NAT-T
+}
+
 
 async def scan(ctx: ScanContext, report: ScanReport, log) -> None:
     """
@@ -11,33 +97,21 @@ async def scan(ctx: ScanContext, report: ScanReport, log) -> None:
     """
     log.info(f"Starting port scan on {ctx.target}")
 
-    # Common ports for Google/Nest WiFi devices and general services
-    common_ports = [22, 23, 53, 80, 443, 8080, 8081, 8443, 9000, 50000, 50001]
-
-    # Additional ports for comprehensive scanning
-    extended_ports = [21, 25, 110, 143, 993, 995, 3389, 5900, 8000, 8888, 9090]
-
     # Use common ports by default, extend if not interactive
-    ports_to_scan = common_ports
-    if not ctx.interactive:
-        ports_to_scan.extend(extended_ports)
+    ports_to_scan = _COMMON_PORTS if ctx.interactive else _COMMON_PORTS + _EXTENDED_PORTS
+
+    ports_before = len(report.ports)
 
     try:
         # Scan TCP ports
-        tcp_results = await _scan_tcp_ports(ctx, ports_to_scan, log)
+        await _scan_tcp_ports(ctx, ports_to_scan, report, log)
 
         # Scan UDP ports (limited set)
-        udp_ports = [53, 67, 68, 123, 161, 500, 4500]
-        udp_results = await _scan_udp_ports(ctx, udp_ports, log)
-
-        # Combine results
-        all_results = tcp_results + udp_results
-
-        # Add to report
-        report.ports.extend(all_results)
+        await _scan_udp_ports(ctx, _UDP_PORTS, report, log)
 
-        if all_results:
-            log.info(f"Found {len(all_results)} open ports on {ctx.target}")
+        found = len(report.ports) - ports_before
+        if found:
+            log.info(f"Found {found} open ports on {ctx.target}")
         else:
             log.info(f"No open ports found on {ctx.target}")
 
@@ -46,44 +120,58 @@ async def scan(ctx: ScanContext, report: ScanReport, log) -> None:
         report.notes.append(f"Port scan error: {str(e)}")
 
 
-async def _scan_tcp_ports(ctx: ScanContext, ports: List[int], log) -> List[PortInfo]:
+async def _scan_tcp_ports(ctx: ScanContext, ports: Sequence[int], report: ScanReport, log) -> None:
     """
-    Scan TCP ports and detect services.
+    Scan TCP ports and add open ones to the report.
     """
-    tasks = []
-    for port in ports:
-        task = _scan_tcp_port(ctx, port, log)
-        tasks.append(task)
-
-    results = await asyncio.gather(*tasks, return_exceptions=True)
+    # Cap simultaneous connections so larger port lists don't exhaust file
+    # descriptors or send the target a SYN burst
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_CONNECTIONS)
+    # Numeric address, so connects skip getaddrinfo
+    ip = ctx.ip
+    host = str(ip)
+    family = socket.AF_INET6 if ip.version == 6 else socket.AF_INET
+
+    async def _bounded_scan(index: int, port: int):
+        async with semaphore:
+            return index, await _scan_tcp_port(ctx, host, family, port, log)
+
+    # Handle ports as they finish; results keep the order ports were given in
+    found = []
+    for next_result in asyncio.as_completed([_bounded_scan(i, port) for i, port in enumerate(ports)]):
+        try:
+            index, result = await next_result
+        except Exception as e:
+            log.debug(f"Port scan exception: {e}")
+            continue
 
-    open_ports = []
-    for result in results:
         if isinstance(result, PortInfo):
-            open_ports.append(result)
-        elif isinstance(result, Exception):
-            log.debug(f"Port scan exception: {result}")
+            found.append((index, result))
 
-    return open_ports
+    report.ports.extend(result for _, result in sorted(found, key=itemgetter(0)))
 
 
-async def _scan_tcp_port(ctx: ScanContext, port: int, log) -> Optional[PortInfo]:
+async def _scan_tcp_port(ctx: ScanContext, host: str, family: int, port: int, log) -> Optional[PortInfo]:
     """
     Scan a single TCP port and attempt service detection.
     """
+    loop = asyncio.get_running_loop()
+
     try:
-        # Connect to port
-        future = asyncio.open_connection(str(ctx.ip), port)
-        reader, writer = await asyncio.wait_for(future, timeout=ctx.timeout)
+        # Plain non-blocking socket; the probe needs no stream buffering
+        with socket.socket(family, socket.SOCK_STREAM) as sock:
+            sock.setblocking(False)
+
+            # Connect to port
+            await asyncio.wait_for(loop.sock_connect(sock, (host, port)), timeout=ctx.timeout)
 
-        log.debug(f"Port {port}/tcp is open on {ctx.target}")
+            log.debug(f"Port {port}/tcp is open on {ctx.target}")
 
-        # Attempt banner grabbing
-        banner = await _grab_tcp_banner(reader, writer, port, ctx.timeout)
+            # Attempt banner grabbing
+            banner = await _grab_tcp_banner(loop, sock, port, ctx.timeout)
 
-        # Close connection
-        writer.close()
-        await writer.wait_closed()
+            # Abort the connection on close; a graceful FIN exchange buys nothing here
+            _reset_on_close(sock)
 
         # Detect service based on port and banner
         service_info = _detect_tcp_service(port, banner)
@@ -106,24 +194,35 @@ async def _scan_tcp_port(ctx: ScanContext, port: int, log) -> Optional[PortInfo]
         return None
 
 
-async def _grab_tcp_banner(reader, writer, port: int, timeout: float) -> Optional[str]:
+def _reset_on_close(sock: socket.socket) -> None:
+    """
+    Make closing the socket send a TCP reset instead of a graceful shutdown.
+    """
+    try:
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_LINGER, _LINGER_RESET)
+    except OSError:
+        pass
+
+
+async def _grab_tcp_banner(loop, sock: socket.socket, port: int, timeout: float) -> Optional[str]:
     """
     Attempt to grab banner from TCP service.
     """
+    if port in _TLS_PORTS:
+        return None
+
     try:
         # Send appropriate probe based on port
         probe = _get_tcp_probe(port)
         if probe:
-            writer.write(probe)
-            await writer.drain()
+            await loop.sock_sendall(sock, probe)
 
         # Read response
-        data = await asyncio.wait_for(reader.read(1024), timeout=timeout)
+        data = await asyncio.wait_for(loop.sock_recv(sock, 1024), timeout=timeout)
 
         if data:
-            banner = data.decode('utf-8', errors='ignore').strip()
-            # Clean up banner (remove control characters)
-            banner = ''.join(char for char in banner if ord(char) >= 32 or char in '\n\r\t')
+            # Clean up banner (remove control characters) before decoding
+            banner = data.translate(None, _CONTROL_BYTES).decode('utf-8', errors='ignore').strip()
             return banner[:200]  # Limit banner length
 
     except (asyncio.TimeoutError, UnicodeDecodeError, ConnectionResetError):
@@ -138,55 +237,55 @@ def _get_tcp_probe(port: int) -> Optional[bytes]:
     """
     Get appropriate probe for specific TCP ports.
     """
-    probes = {
-        21: b"HELP\r\n",                    # FTP
-        22: b"SSH-2.0-Test\r\n",           # SSH
-        23: b"\r\n",                       # Telnet
-        25: b"EHLO test\r\n",              # SMTP
-        53: b"",                           # DNS (no probe needed)
-        80: b"GET / HTTP/1.0\r\n\r\n",     # HTTP
-        110: b"USER test\r\n",             # POP3
-        143: b"A001 CAPABILITY\r\n",       # IMAP
-        443: b"",                          # HTTPS (TLS handshake too complex)
-        993: b"",                          # IMAPS
-        995: b"",                          # POP3S
-    }
+    return _TCP_PROBES.get(port, b"")
 
-    return probes.get(port, b"")
+
+def _detect_ssh(service_info: dict, banner: str, banner_lower: str) -> None:
+    service_info['service'] = 'ssh'
+    if 'openssh' in banner_lower:
+        service_info['product'] = 'OpenSSH'
+    # Extract version
+    version_match = _SSH_VER_RE.search(banner)
+    if version_match:
+        service_info['version'] = version_match.group(1)
+
+
+def _detect_http(service_info: dict, banner: str, banner_lower: str) -> None:
+    service_info['service'] = 'http'
+    # Extract server info
+    server_match = _HTTP_SERVER_RE.search(banner)
+    if server_match:
+        service_info['product'] = server_match.group(1).strip()
+
+
+def _detect_ftp(service_info: dict, banner: str, banner_lower: str) -> None:
+    service_info['service'] = 'ftp'
+    if 'vsftpd' in banner_lower:
+        service_info['product'] = 'vsftpd'
+    elif 'proftpd' in banner_lower:
+        service_info['product'] = 'ProFTPD'
+
+
+def _detect_telnet(service_info: dict, banner: str, banner_lower: str) -> None:
+    service_info['service'] = 'telnet'
+
+
+# Checked in order against the lowercased banner; the first token found wins.
+_DETECTORS = (
+    ('ssh', _detect_ssh),
+    ('http', _detect_http),
+    ('server:', _detect_http),
+    ('ftp', _detect_ftp),
+    ('telnet', _detect_telnet),
+)
 
 
 def _detect_tcp_service(port: int, banner: Optional[str]) -> dict:
     """
     Detect service based on port number and banner.
     """
-    # Common port to service mappings
-    port_services = {
-        21: "ftp",
-        22: "ssh",
-        23: "telnet",
-        25: "smtp",
-        53: "domain",
-        80: "http",
-        110: "pop3",
-        143: "imap",
-        443: "https",
-        993: "imaps",
-        995: "pop3s",
-        3389: "rdp",
-        5900: "vnc",
-        8000: "http-alt",
-        8080: "http-proxy",
-        8081: "http-alt",
-        8443: "https-alt",
-        8888: "http-alt",
-        9000: "http-alt",
-        9090: "http-alt",
-        50000: "unknown",
-        50001: "unknown"
-    }
-
     service_info = {
-        'service': port_services.get(port),
+        'service': _TCP_PORT_SERVICES.get(port),
         'product': None,
         'version': None,
         'fingerprint': None
@@ -196,85 +295,80 @@ def _detect_tcp_service(port: int, banner: Optional[str]) -> dict:
         # Analyze banner for service details
         banner_lower = banner.lower()
 
-        # SSH detection
-        if 'ssh' in banner_lower:
-            service_info['service'] = 'ssh'
-            if 'openssh' in banner_lower:
-                service_info['product'] = 'OpenSSH'
-            # Extract version
-            import re
-            version_match = re.search(r'ssh-[\d.]+[_-]([^\s\r\n]+)', banner, re.IGNORECASE)
-            if version_match:
-                service_info['version'] = version_match.group(1)
-
-        # HTTP detection
-        elif 'http' in banner_lower or 'server:' in banner_lower:
-            service_info['service'] = 'http'
-            # Extract server info
-            server_match = re.search(r'server:\s*([^\r\n]+)', banner, re.IGNORECASE)
-            if server_match:
-                server_info = server_match.group(1).strip()
-                service_info['product'] = server_info
-
-        # FTP detection
-        elif 'ftp' in banner_lower:
-            service_info['service'] = 'ftp'
-            if 'vsftpd' in banner_lower:
-                service_info['product'] = 'vsftpd'
-            elif 'proftpd' in banner_lower:
-                service_info['product'] = 'ProFTPD'
-
-        # Telnet detection
-        elif 'telnet' in banner_lower or port == 23:
-            service_info['service'] = 'telnet'
+        for token, detect in _DETECTORS:
+            if token in banner_lower:
+                detect(service_info, banner, banner_lower)
+                break
+        else:
+            if port == 23:
+                _detect_telnet(service_info, banner, banner_lower)
 
         # Create fingerprint
         if service_info['service']:
-            fp_parts = [f"service:{service_info['service']}"]
+            fingerprint = f"service:{service_info['service']}"
             if service_info['product']:
-                fp_parts.append(f"product:{service_info['product']}")
+                fingerprint += f"|product:{service_info['product']}"
             if service_info['version']:
-                fp_parts.append(f"version:{service_info['version']}")
-            service_info['fingerprint'] = "|".join(fp_parts)
+                fingerprint += f"|version:{service_info['version']}"
+            service_info['fingerprint'] = fingerprint
 
     return service_info
 
 
-async def _scan_udp_ports(ctx: ScanContext, ports: List[int], log) -> List[PortInfo]:
+async def _scan_udp_ports(ctx: ScanContext, ports: Sequence[int], report: ScanReport, log) -> None:
     """
-    Scan UDP ports (limited functionality).
+    Scan UDP ports (limited functionality) and add open ones to the report.
     """
+    host = str(ctx.ip)
     tasks = []
     for port in ports:
-        task = _scan_udp_port(ctx, port, log)
+        task = _scan_udp_port(ctx, host, port, log)
         tasks.append(task)
 
     results = await asyncio.gather(*tasks, return_exceptions=True)
 
-    open_ports = []
     for result in results:
         if isinstance(result, PortInfo):
-            open_ports.append(result)
+            report.ports.append(result)
 
-    return open_ports
 
+class _UDPProbeProtocol(asyncio.DatagramProtocol):
+    """Resolves a future with the first datagram (or ICMP error) received."""
 
-async def _scan_udp_port(ctx: ScanContext, port: int, log) -> Optional[PortInfo]:
+    def __init__(self, response: asyncio.Future):
+        self.response = response
+
+    def datagram_received(self, data: bytes, addr) -> None:
+        if not self.response.done():
+            self.response.set_result(data)
+
+    def error_received(self, exc: Exception) -> None:
+        if not self.response.done():
+            self.response.set_exception(exc)
+
+
+async def _scan_udp_port(ctx: ScanContext, host: str, port: int, log) -> Optional[PortInfo]:
     """
     Scan a single UDP port.
     """
+    loop = asyncio.get_running_loop()
+    response = loop.create_future()
+    transport = None
+
     try:
-        # Create UDP socket
-        sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
-        sock.settimeout(ctx.timeout)
+        # Create UDP endpoint; connecting it lets ICMP port-unreachable surface as an error
+        transport, _ = await loop.create_datagram_endpoint(
+            lambda: _UDPProbeProtocol(response),
+            remote_addr=(host, port)
+        )
 
         # Send probe
         probe = _get_udp_probe(port)
-        sock.sendto(probe, (str(ctx.ip), port))
+        transport.sendto(probe)
 
         # Try to receive response
         try:
-            data, addr = sock.recvfrom(1024)
+            data = await asyncio.wait_for(response, timeout=ctx.timeout)
             banner = data.decode('utf-8', errors='ignore').strip()[:200]
 
             service_info = _detect_udp_service(port, banner)
@@ -286,7 +380,7 @@ async def _scan_udp_port(ctx: ScanContext, port: int, log) -> Optional[PortInfo]
                 service=service_info.get('service'),
                 fingerprint=service_info.get('fingerprint')
             )
-        except socket.timeout:
+        except asyncio.TimeoutError:
             # No response - might still be open
             service_info = _detect_udp_service(port, None)
             return PortInfo(
@@ -296,46 +390,30 @@ async def _scan_udp_port(ctx: ScanContext, port: int, log) -> Optional[PortInfo]
                 fingerprint=service_info.get('fingerprint')
             )
 
+    except ConnectionRefusedError:
+        # ICMP port unreachable - port is closed
+        return None
     except Exception as e:
         log.debug(f"Error scanning UDP port {port}: {e}")
         return None
     finally:
-        sock.close()
+        if transport is not None:
+            transport.close()
 
 
 def _get_udp_probe(port: int) -> bytes:
     """
     Get appropriate probe for UDP ports.
     """
-    probes = {
-        53: b"\x12\x34\x01\x00\x00\x01\x00\x00\x00\x00\x00\x00\x03www\x06google\x03com\x00\x00\x01\x00\x01",  # DNS query
-        67: b"",   # DHCP
-        68: b"",   # DHCP
-        123: b"\x1b" + b"\x00" * 47,  # NTP
-        161: b"\x30\x26\x02\x01\x01\x04\x06public\xa0\x19\x02\x04\x00\x00\x00\x00\x02\x01\x00\x02\x01\x00\x30\x0b\x30\x09\x06\x05\x2b\x06\x01\x02\x01\x05\x00",  # SNMP
-        500: b"",  # IKE
-        4500: b"",  # IPSec NAT-T
-    }
-
-    return probes.get(port, b"")
+    return _UDP_PROBES.get(port, b"")
 
 
 def _detect_udp_service(port: int, banner: str | None) -> dict:
     """
     Detect UDP service based on port and response.
     """
-    port_services = {
-        53: "domain",
-        67: "dhcps",
-        68: "dhcpc",
-        123: "ntp",
-        161: "snmp",
-        500: "isakmp",
-        4500: "ipsec-nat-t"
-    }
-
     service_info = {
-        'service': port_services.get(port),
+        'service': _UDP_PORT_SERVICES.get(port),
         'fingerprint': None
     }
 